@@ -2,100 +2,149 @@
 
 import asyncio
 import logging
-import sys
-from pathlib import Path
+import random
+import re
+from dataclasses import dataclass, field
 
+import httpx
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.helpers import config_validation as cv
 
 from .const import (
     DOMAIN,
+    GARDENA_ENTRIES,
     GARDENA_LOCATION,
     GARDENA_SYSTEM,
 )
+from .gardena.exceptions.authentication_exception import AuthenticationException
+from .gardena.location import Location
+from .gardena.smart_system import SmartSystem
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema("gardena_smart_system")
 
-# Ensure gardena module can be imported
-current_dir = Path(__file__).parent
-if str(current_dir) not in sys.path:
-    sys.path.insert(0, str(current_dir))
+_LOGGER = logging.getLogger(__name__)
+
+PLATFORMS = ["sensor", "switch", "valve", "binary_sensor", "lawn_mower"]
+
+# Backoff settings for authentication retries
+AUTH_MAX_BACKOFF = 120  # Maximum delay between attempts in seconds
+AUTH_BACKOFF_JITTER = 0.5  # Up to +50% random jitter on each delay
+
+# OS-seeded random source for backoff jitter
+_RANDOM = random.SystemRandom()
 
-# Import gardena modules after path setup
-from gardena.exceptions.authentication_exception import (
-    AuthenticationException,
+# Maximum time in seconds to wait for old sessions to disconnect
+SESSION_CLEANUP_TIMEOUT = 8
+
+# Error messages indicating another session is still active for the client
+_SIMULTANEOUS_LOGIN_RE = re.compile(
+    r"simultaneous login|already authenticated|session already exists"
+    r"|invalid_request.*client|client.*invalid_request",
+    re.IGNORECASE | re.DOTALL,
 )
 
-from .gardena.location import Location  # noqa: E402
-from .gardena.smart_system import SmartSystem  # noqa: E402
+# Network failures that may clear up on their own and are worth retrying
+_TRANSIENT_ERRORS = (ConnectionError, TimeoutError, httpx.TransportError)
 
-_LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = ["sensor", "switch", "valve", "binary_sensor", "lawn_mower"]
+@dataclass
+class GardenaEntryData:
+    """Runtime objects belonging to one config entry."""
 
+    smart_system: SmartSystem
+    wrapper: "GardenaSmartSystem | None" = None
+    shutdown_event: asyncio.Event = field(default_factory=asyncio.Event)
 
-async def _check_and_cleanup_existing_sessions(hass: HomeAssistant) -> None:
-    """Check for and cleanup any existing sessions or WebSocket connections."""
+
+async def _check_and_cleanup_existing_sessions(
+    hass: HomeAssistant, current_entry_id: str
+) -> None:
+    """Check for and cleanup any existing sessions or WebSocket connections.
+
+    The entry currently being set up is left untouched.
+    """
     _LOGGER.debug("Checking for existing Gardena sessions in Home Assistant")
 
     # Check if DOMAIN exists and has active sessions
     if DOMAIN in hass.data:
-        domain_data = hass.data[DOMAIN]
-        cleanup_performed = False
-
-        # Check for existing SmartSystem instances
-        for key, value in list(domain_data.items()):
-            if isinstance(value, SmartSystem):
-                _LOGGER.warning("Found existing SmartSystem session, cleaning up...")
-                cleanup_performed = True
-                try:
-                    await value.quit()
-                    _LOGGER.debug("Successfully cleaned up SmartSystem session")
-                    # Remove from data
-                    domain_data.pop(key, None)
-                except Exception as ex:
-                    _LOGGER.debug("Error during SmartSystem cleanup: %s", ex)
-
-            # Check for GardenaSmartSystem instances
-            elif hasattr(value, "smart_system") and hasattr(value, "stop"):
-                _LOGGER.warning(
-                    "Found existing GardenaSmartSystem session, cleaning up..."
-                )
-                cleanup_performed = True
-                try:
-                    await value.stop()
-                    _LOGGER.debug("Successfully cleaned up GardenaSmartSystem session")
-                    # Remove from data
-                    domain_data.pop(key, None)
-                except Exception as ex:
-                    _LOGGER.debug("Error during GardenaSmartSystem cleanup: %s", ex)
-
-        if cleanup_performed:
-            # Additional wait to ensure sessions are fully terminated
-            _LOGGER.debug("Waiting for session cleanup to complete...")
-            await asyncio.sleep(8)  # Increased wait time
-        else:
+        entries = hass.data[DOMAIN][GARDENA_ENTRIES]
+        others = {
+            entry_id: data
+            for entry_id, data in entries.items()
+            if entry_id != current_entry_id
+        }
+        if not others:
             _LOGGER.debug("No existing sessions found to cleanup")
+            return
+
+        _LOGGER.warning("Found %d existing session(s), cleaning up...", len(others))
+        stopped_systems = [data.smart_system for data in others.values()]
+        # Tear down all sessions concurrently; stopping a WebSocket wrapper
+        # also logs out its SmartSystem
+        results = await asyncio.gather(
+            *(
+                data.wrapper.stop() if data.wrapper else data.smart_system.quit()
+                for data in others.values()
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                _LOGGER.debug("Error during session cleanup: %s", result)
+        for entry_id in others:
+            entries.pop(entry_id, None)
+
+        # Wait until all WebSocket connections report closed, at most 8 seconds
+        _LOGGER.debug("Waiting for session cleanup to complete...")
+        for _ in range(SESSION_CLEANUP_TIMEOUT):
+            if not any(ss.is_ws_connected for ss in stopped_systems):
+                break
+            await asyncio.sleep(1)
     else:
         _LOGGER.debug("No domain data found")
 
 
+def _backoff_delay(base: float, attempt: int) -> float:
+    """Return an exponential backoff delay with random jitter for an attempt."""
+    return min(
+        base * (2**attempt) * (1 + _RANDOM.uniform(0, AUTH_BACKOFF_JITTER)),
+        AUTH_MAX_BACKOFF,
+    )
+
+
+async def _wait_for_shutdown(shutdown_event: asyncio.Event, delay: float) -> bool:
+    """Wait for the given delay; return True if shutdown was requested meanwhile."""
+    try:
+        await asyncio.wait_for(shutdown_event.wait(), timeout=delay)
+    except TimeoutError:
+        return False
+    return True
+
+
 async def _authenticate_with_retry(
-    smart_system: SmartSystem, hass: HomeAssistant
-) -> None:
-    """Authenticate with retry logic for simultaneous logins."""
+    smart_system: SmartSystem,
+    hass: HomeAssistant,
+    entry_id: str,
+    shutdown_event: asyncio.Event,
+) -> bool:
+    """Authenticate, retrying simultaneous logins and transient network errors.
+
+    Returns False if shutdown was requested before authentication succeeded.
+    """
     max_retries = 3  # Reduced since we now have better cleanup
-    base_wait_time = 15  # Reduced base wait time since cleanup is more thorough
+    base_wait_time = 15  # Base wait time, doubled on every attempt
+    base_cleanup_wait = 5  # Base wait for API session cleanup before a retry
+    session_conflict = False
 
     for attempt in range(max_retries):
         try:
-            # For retry attempts, ensure clean state
-            if attempt > 0:
+            # After a session conflict, ensure clean state before retrying
+            if session_conflict:
                 _LOGGER.debug("Cleaning up before retry attempt %d", attempt + 1)
 
                 # Check for and cleanup any existing sessions first
-                await _check_and_cleanup_existing_sessions(hass)
+                await _check_and_cleanup_existing_sessions(hass, entry_id)
 
                 # Force logout current session
                 try:
@@ -104,36 +153,36 @@ async def _authenticate_with_retry(
                 except Exception as ex:
                     _LOGGER.debug("Error during current session cleanup: %s", ex)
 
-                # Progressive wait for API session cleanup
-                cleanup_wait = 5 + (attempt * 5)  # 5s, 10s, 15s
+                # Exponential wait for API session cleanup
+                cleanup_wait = _backoff_delay(base_cleanup_wait, attempt - 1)
                 _LOGGER.debug(
-                    "Waiting %d seconds for API session cleanup", cleanup_wait
+                    "Waiting %.1f seconds for API session cleanup", cleanup_wait
                 )
-                await asyncio.sleep(cleanup_wait)
+                if await _wait_for_shutdown(shutdown_event, cleanup_wait):
+                    return False
 
             _LOGGER.debug("Authentication attempt %d/%d", attempt + 1, max_retries)
             await smart_system.authenticate()
             _LOGGER.info("Authentication successful on attempt %d", attempt + 1)
-            return
+            return True
 
         except Exception as ex:
-            error_msg = str(ex).lower()
-
             # Check for simultaneous login error specifically
-            is_simultaneous_login = (
-                "simultaneous logins detected" in error_msg
-                or "simultaneous login" in error_msg
-                or ("invalid_request" in error_msg and "client" in error_msg)
-                or "already authenticated" in error_msg
-                or "session already exists" in error_msg
-            )
+            is_simultaneous_login = bool(_SIMULTANEOUS_LOGIN_RE.search(str(ex)))
+            session_conflict = is_simultaneous_login
+
+            # Authentication errors other than session conflicts (e.g. bad
+            # credentials) cannot be fixed by retrying, so fail immediately
+            if isinstance(ex, AuthenticationException) and not is_simultaneous_login:
+                _LOGGER.exception("Authentication failed with unrecoverable error")
+                raise
 
             if is_simultaneous_login and attempt < max_retries - 1:
-                wait_time = base_wait_time + (attempt * 10)  # 15s, 25s, 35s
+                wait_time = _backoff_delay(base_wait_time, attempt)
                 _LOGGER.warning(
                     "Simultaneous login detected (attempt %d/%d). This indicates "
                     "an existing session is still active from this integration. "
-                    "Performing thorough cleanup and waiting %d seconds...",
+                    "Performing thorough cleanup and waiting %.1f seconds...",
                     attempt + 1,
                     max_retries,
                     wait_time,
@@ -145,7 +194,23 @@ async def _authenticate_with_retry(
                     "3) Ensuring proper session termination on API server\n"
                     "Note: The official Gardena app uses different credentials and should not conflict"
                 )
-                await asyncio.sleep(wait_time)
+                if await _wait_for_shutdown(shutdown_event, wait_time):
+                    return False
+                continue
+
+            # Connection problems and timeouts are usually temporary
+            if isinstance(ex, _TRANSIENT_ERRORS) and attempt < max_retries - 1:
+                wait_time = _backoff_delay(base_cleanup_wait, attempt)
+                _LOGGER.warning(
+                    "Transient error during authentication (attempt %d/%d): %s. "
+                    "Retrying in %.1f seconds",
+                    attempt + 1,
+                    max_retries,
+                    ex,
+                    wait_time,
+                )
+                if await _wait_for_shutdown(shutdown_event, wait_time):
+                    return False
                 continue
 
             # For final attempt or non-login errors, provide helpful context
@@ -179,7 +244,7 @@ async def _authenticate_with_retry(
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the Gardena Smart System component."""
-    hass.data.setdefault(DOMAIN, {})
+    hass.data.setdefault(DOMAIN, {GARDENA_ENTRIES: {}})
 
     # Defer service registration to avoid blocking startup
     async def _register_services_background():
@@ -205,16 +270,14 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
             # Implementation depends on the specific mower entity
 
         # Register services
-        hass.services.async_register(DOMAIN, "start_mowing", start_mowing_service)
-        hass.services.async_register(
-            DOMAIN, "park_until_next_task", park_until_next_task_service
-        )
-        hass.services.async_register(
-            DOMAIN, "park_until_further_notice", park_until_further_notice_service
-        )
-        hass.services.async_register(
-            DOMAIN, "start_dont_override", start_dont_override_service
-        )
+        services = {
+            "start_mowing": start_mowing_service,
+            "park_until_next_task": park_until_next_task_service,
+            "park_until_further_notice": park_until_further_notice_service,
+            "start_dont_override": start_dont_override_service,
+        }
+        for name, handler in services.items():
+            hass.services.async_register(DOMAIN, name, handler)
 
     # Register services in background to not block startup
     hass.async_create_task(
@@ -226,7 +289,8 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Gardena Smart System from a config entry."""
-    hass.data.setdefault(DOMAIN, {})
+    domain_data = hass.data[DOMAIN]
+    entries = domain_data[GARDENA_ENTRIES]
 
     # Create SmartSystem instance directly for initial setup
     smart_system = SmartSystem(
@@ -235,17 +299,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     # Store in hass data immediately
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = smart_system
+    entry_data = GardenaEntryData(smart_system)
+    entries[entry.entry_id] = entry_data
 
     # Create a background task for complete setup including platform forwarding
     async def _complete_setup_background():
         """Complete setup including authentication, device loading, and platform forwarding."""
         try:
             # Add timeout and retry logic for authentication
-            await asyncio.wait_for(
-                _authenticate_with_retry(smart_system, hass),
+            authenticated = await asyncio.wait_for(
+                _authenticate_with_retry(
+                    smart_system, hass, entry.entry_id, entry_data.shutdown_event
+                ),
                 timeout=120,  # 2 minutes total timeout
             )
+            if not authenticated:
+                _LOGGER.debug("Setup aborted, config entry is being unloaded")
+                return
 
             # After successful authentication, update locations
             await smart_system.update_locations()
@@ -257,24 +327,47 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             if not smart_system.locations:
                 _LOGGER.error("No locations found in your Gardena account")
                 # Clean up and mark as failed
-                hass.data[DOMAIN].pop(entry.entry_id, None)
+                entries.pop(entry.entry_id, None)
                 return
 
-            # Load devices for each location
-            for location in smart_system.locations.values():
-                await smart_system.update_devices(location)
+            # Load devices for all locations concurrently
+            locations = list(smart_system.locations.values())
+            results = await asyncio.gather(
+                *(smart_system.update_devices(location) for location in locations),
+                return_exceptions=True,
+            )
+            loaded_locations = []
+            for location, result in zip(locations, results, strict=True):
+                if isinstance(result, Exception):
+                    _LOGGER.error(
+                        "Failed to load devices for location %s: %s",
+                        location.name,
+                        result,
+                    )
+                    continue
+                loaded_locations.append(location)
                 _LOGGER.debug(
                     "Loaded %d devices for location %s",
                     len(location.devices),
                     location.name,
                 )
 
+            if not loaded_locations:
+                _LOGGER.error("Failed to load devices for any Gardena location")
+                entries.pop(entry.entry_id, None)
+                return
+
             # Store location data for platforms to access
-            first_location = next(iter(smart_system.locations.values()))
-            hass.data[DOMAIN][GARDENA_LOCATION] = first_location
+            first_location = loaded_locations[0]
+            domain_data[GARDENA_LOCATION] = first_location
 
             _LOGGER.info("Gardena Smart System setup completed successfully")
 
+            if entry_data.shutdown_event.is_set():
+                _LOGGER.debug("Setup aborted, config entry is being unloaded")
+                await smart_system.quit()
+                return
+
             # Now forward entry setups to platforms with data available
             await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
             _LOGGER.debug("Platforms setup completed successfully")
@@ -283,10 +376,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             gardena_system = GardenaSmartSystem(
                 hass=hass,
                 smart_system=smart_system,  # Pass the already authenticated instance
+                location=first_location,
             )
 
             # Store the wrapper for WebSocket management
-            hass.data[DOMAIN][f"{entry.entry_id}_websocket"] = gardena_system
+            entry_data.wrapper = gardena_system
+
+            if entry_data.shutdown_event.is_set():
+                _LOGGER.debug("Setup aborted, config entry is being unloaded")
+                await smart_system.quit()
+                return
 
             # Start WebSocket connection
             _LOGGER.info("Starting WebSocket connection for real-time updates")
@@ -299,9 +398,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 "Failed to set up Gardena Smart System: %s", type(ex).__name__
             )
             # Clean up stored data on failure
-            hass.data[DOMAIN].pop(entry.entry_id, None)
-            if not hass.data[DOMAIN]:
-                hass.data.pop(DOMAIN, None)
+            entries.pop(entry.entry_id, None)
 
     # Start complete setup in background
     _LOGGER.debug("Starting Gardena Smart System complete setup in background")
@@ -331,15 +428,8 @@ async def _register_services(hass: HomeAssistant, gardena_system) -> None:
         if detailed:
             diagnostics.update(
                 {
-                    "location_count": len(gardena_system.smart_system.locations)
-                    if gardena_system.smart_system
-                    else 0,
-                    "device_count": sum(
-                        len(loc.devices)
-                        for loc in gardena_system.smart_system.locations.values()
-                    )
-                    if gardena_system.smart_system
-                    else 0,
+                    "location_count": gardena_system.location_count,
+                    "device_count": gardena_system.device_count,
                     "has_active_task": gardena_system._ws_task is not None
                     and not gardena_system._ws_task.done(),
                     "shutdown_event_set": gardena_system._shutdown_event.is_set(),
@@ -365,6 +455,14 @@ async def _register_services(hass: HomeAssistant, gardena_system) -> None:
     hass.services.async_register(DOMAIN, "reload", reload_service)
 
 
+async def _wait_for_ws_disconnect(smart_system: SmartSystem) -> None:
+    """Wait up to 3 seconds for the WebSocket of a SmartSystem to disconnect."""
+    for _ in range(30):
+        if not smart_system.is_ws_connected:
+            break
+        await asyncio.sleep(0.1)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.debug("Unloading Gardena Smart System component")
@@ -373,28 +471,36 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
+        domain_data = hass.data[DOMAIN]
+
         # Stop the SmartSystem and clean up resources properly
-        smart_system = hass.data[DOMAIN].get(entry.entry_id)
-        if smart_system:
+        entry_data = domain_data[GARDENA_ENTRIES].pop(entry.entry_id, None)
+        if entry_data:
+            # Abort any authentication retry wait still in progress
+            entry_data.shutdown_event.set()
             _LOGGER.debug("Stopping SmartSystem and cleaning up session")
             try:
-                # Ensure proper logout to clean up API session
-                await smart_system.quit()
+                # Ensure proper logout to clean up API session; stopping the
+                # WebSocket wrapper also logs out its SmartSystem
+                if entry_data.wrapper:
+                    await entry_data.wrapper.stop()
+                else:
+                    await entry_data.smart_system.quit()
                 _LOGGER.debug("SmartSystem session cleaned up successfully")
-                # Additional wait to ensure session is fully terminated on server side
-                await asyncio.sleep(3)
+                # Wait until the session is actually disconnected
+                await _wait_for_ws_disconnect(entry_data.smart_system)
             except Exception as ex:
                 _LOGGER.warning("Error during SmartSystem cleanup: %s", ex)
 
         # Clean up legacy GardenaSmartSystem if it exists
-        gardena_system = hass.data[DOMAIN].get(GARDENA_SYSTEM)
+        gardena_system = domain_data.pop(GARDENA_SYSTEM, None)
         if gardena_system:
             _LOGGER.debug("Stopping legacy GardenaSmartSystem")
             try:
                 await gardena_system.stop()
-                # Give a moment for the WebSocket to close properly
+                # Give the WebSocket a moment to close properly
                 _LOGGER.debug("Waiting for WebSocket connection to close...")
-                await asyncio.sleep(2)
+                await _wait_for_ws_disconnect(gardena_system.smart_system)
             except Exception as ex:
                 _LOGGER.warning("Error during GardenaSmartSystem stop: %s", ex)
 
@@ -409,13 +515,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             hass.services.async_remove(DOMAIN, "websocket_diagnostics")
             hass.services.async_remove(DOMAIN, "reload")
 
-        # Clean up stored data
-        if DOMAIN in hass.data:
-            hass.data[DOMAIN].pop(GARDENA_SYSTEM, None)
-            hass.data[DOMAIN].pop(GARDENA_LOCATION, None)
-            # If no more entries, remove the domain entirely
-            if not hass.data[DOMAIN]:
-                hass.data.pop(DOMAIN, None)
+        # Clean up remaining stored data
+        domain_data.pop(GARDENA_LOCATION, None)
 
         _LOGGER.debug("Gardena Smart System component unloaded successfully")
     else:
@@ -428,10 +529,16 @@ class GardenaSmartSystem:
     """A Gardena Smart System wrapper class."""
 
     def __init__(
-        self, hass, smart_system=None, client_id=None, client_secret=None
+        self,
+        hass,
+        smart_system=None,
+        client_id=None,
+        client_secret=None,
+        location: Location | None = None,
     ) -> None:
         """Initialize the Gardena Smart System."""
         self._hass = hass
+        self._location = location
         self._ws_task = None
         self._shutdown_event = asyncio.Event()
         _LOGGER.debug("Initializing GardenaSmartSystem wrapper")
@@ -449,24 +556,34 @@ class GardenaSmartSystem:
                 client_secret=client_secret,
             )
 
+    @property
+    def location_count(self) -> int:
+        """Return the number of loaded locations."""
+        return len(self.smart_system.locations)
+
+    @property
+    def device_count(self) -> int:
+        """Return the number of loaded devices."""
+        return len(self.smart_system.devices)
+
     async def start(self) -> None:
         """Start WebSocket connection using existing authenticated smart_system."""
         try:
             _LOGGER.debug("Starting GardenaSmartSystem websocket connection")
 
             # Skip authentication since smart_system is already authenticated
-            if not self.smart_system.locations:
-                _LOGGER.error("No locations available for WebSocket connection")
-                return
-
-            # Use the first (and typically only) location
-            location = next(iter(self.smart_system.locations.values()))
+            location = self._location
+            if location is None:
+                if not self.smart_system.locations:
+                    _LOGGER.error("No locations available for WebSocket connection")
+                    return
+
+                # Use the first (and typically only) location
+                location = self._location = next(
+                    iter(self.smart_system.locations.values())
+                )
+                self._hass.data[DOMAIN][GARDENA_LOCATION] = location
             _LOGGER.debug("Using location: %s (%s)", location.name, location.id)
-
-            # Ensure hass.data[DOMAIN] is initialized
-            if DOMAIN not in self._hass.data:
-                self._hass.data[DOMAIN] = {}
-            self._hass.data[DOMAIN][GARDENA_LOCATION] = location
             _LOGGER.debug("Starting GardenaSmartSystem websocket connection")
 
             # Start WebSocket with proper task management
@@ -496,6 +613,8 @@ class GardenaSmartSystem:
                     _LOGGER.debug("WebSocket connection ended due to shutdown")
                     break
                 _LOGGER.warning("WebSocket connection ended unexpectedly")
+                # The connection was up, so start the backoff over
+                reconnect_attempts = 0
 
             except Exception:
                 _LOGGER.exception("WebSocket connection error")
@@ -503,12 +622,15 @@ class GardenaSmartSystem:
 
             # Exponential backoff for reconnection
             if not self._shutdown_event.is_set():
+                # Jitter decorrelates reconnects of multiple instances
                 current_delay = min(
-                    reconnect_delay * (2 ** min(reconnect_attempts - 1, 5)),
+                    reconnect_delay
+                    * (2 ** min(max(reconnect_attempts - 1, 0), 5))
+                    * (1 + _RANDOM.uniform(0, AUTH_BACKOFF_JITTER)),
                     max_reconnect_delay,
                 )
                 _LOGGER.info(
-                    "Reconnecting WebSocket in %d seconds (attempt %d)",
+                    "Reconnecting WebSocket in %.1f seconds (attempt %d)",
                     current_delay,
                     reconnect_attempts,
                 )
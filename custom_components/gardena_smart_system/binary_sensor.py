@@ -8,7 +8,7 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -17,108 +17,125 @@ from .const import (
     ATTR_RF_LINK_LEVEL,
     ATTR_RF_LINK_STATE,
     DOMAIN,
-    GARDENA_LOCATION,
+    GARDENA_ENTRIES,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Device types that get a connectivity sensor, in entity creation order
+DEVICE_TYPES = (
+    "MOWER",
+    "SMART_IRRIGATION_CONTROL",
+    "POWER_SOCKET",
+    "SENSOR",
+    "WATER_CONTROL",
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    _config_entry: ConfigEntry,
+    config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the binary sensor platform."""
-    entities = []
-
-    # Get the location from hass data
-    location = hass.data[DOMAIN][GARDENA_LOCATION]
+    # Devices of all locations of the account
+    entry_data = hass.data[DOMAIN][GARDENA_ENTRIES][config_entry.entry_id]
+    smart_system = entry_data.smart_system
 
-    # Add websocket status sensor using the location's smart_system
-    entities.append(SmartSystemWebsocketStatus(location.smart_system))
+    # Websocket status sensor plus connectivity sensors for all device types
+    entities = [
+        SmartSystemWebsocketStatus(smart_system),
+        *(
+            GardenaConnectivitySensor(device)
+            for device_type in DEVICE_TYPES
+            for device in smart_system.find_device_by_type(device_type)
+        ),
+    ]
 
-    # Add connectivity sensors for all device types
-    for device_type in [
-        "MOWER",
-        "SMART_IRRIGATION_CONTROL",
-        "POWER_SOCKET",
-        "SENSOR",
-        "WATER_CONTROL",
-    ]:
-        for device in location.find_device_by_type(device_type):
-            entities.append(GardenaConnectivitySensor(device))
-
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities, update_before_add=False)
 
 
 class SmartSystemWebsocketStatus(BinarySensorEntity):
     """Representation of Gardena Smart System websocket connection status."""
 
+    _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
+    _attr_name = "Gardena Smart System Websocket"
+    _attr_unique_id = "gardena_smart_system_websocket_status"
+
     def __init__(self, smart_system: Any) -> None:
         """Initialize the websocket status sensor."""
         self._smart_system = smart_system
-        self._attr_name = "Gardena Smart System Websocket"
-        self._attr_unique_id = "gardena_smart_system_websocket_status"
+        self._attr_is_on = smart_system.is_ws_connected
 
-    @property
-    def is_on(self) -> bool:
-        """Return true if the websocket is connected."""
-        return self._smart_system.is_ws_connected
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to websocket status changes and write the first state."""
+        self._smart_system.add_ws_status_callback(self.update_callback)
+        self._attr_is_on = self._smart_system.is_ws_connected
+        self.async_write_ha_state()
 
-    @property
-    def device_class(self) -> str:
-        """Return the class of this device."""
-        return BinarySensorDeviceClass.CONNECTIVITY
+    @callback
+    def update_callback(self, status: bool) -> None:
+        """Update the sensor state if the connection status changed."""
+        if status == self._attr_is_on:
+            return
+        self._attr_is_on = status
+        self.async_write_ha_state()
 
 
 class GardenaConnectivitySensor(BinarySensorEntity):
     """Representation of a Gardena device connectivity sensor."""
 
+    _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
+
     def __init__(self, device: Any) -> None:
         """Initialize the connectivity sensor."""
         self._device = device
         self._attr_name = f"{device.name} Connectivity"
         self._attr_unique_id = f"{device.serial}_connectivity"
-
-    @property
-    def is_on(self) -> bool:
-        """Return true if the device is connected."""
-        return getattr(self._device, ATTR_RF_LINK_STATE, "OFFLINE") == "ONLINE"
-
-    @property
-    def device_class(self) -> str:
-        """Return the class of this device."""
-        return BinarySensorDeviceClass.CONNECTIVITY
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return the state attributes."""
-        attributes = {}
-
-        # Add battery state if available
-        if hasattr(self._device, ATTR_BATTERY_STATE):
-            attributes[ATTR_BATTERY_STATE] = getattr(self._device, ATTR_BATTERY_STATE)
-
-        # Add RF link level if available
-        if hasattr(self._device, ATTR_RF_LINK_LEVEL):
-            attributes[ATTR_RF_LINK_LEVEL] = getattr(self._device, ATTR_RF_LINK_LEVEL)
-
-        # Add RF link state if available
-        if hasattr(self._device, ATTR_RF_LINK_STATE):
-            attributes[ATTR_RF_LINK_STATE] = getattr(self._device, ATTR_RF_LINK_STATE)
-
-        return attributes
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device.serial)},
-            name=self._device.name,
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, device.serial)},
+            name=device.name,
             manufacturer="Gardena",
-            model=getattr(self._device, "model_type", "Unknown"),
+            model=getattr(device, "model_type", "Unknown"),
         )
-
-    def update_callback(self) -> None:
-        """Update the sensor state."""
-        self.schedule_update_ha_state(force_refresh=True)
+        # Resolve once which of the optional fields this device type declares
+        self._state_keys = tuple(
+            key
+            for key in (ATTR_BATTERY_STATE, ATTR_RF_LINK_LEVEL, ATTR_RF_LINK_STATE)
+            if type(device).declares(key)
+        )
+        self._attr_extra_state_attributes = {}
+        self._refresh_state()
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to device updates and write the first state."""
+        self._device.add_callback(self.update_callback)
+        self._refresh_state()
+        self.async_write_ha_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Unsubscribe from device updates."""
+        self._device.remove_callback(self.update_callback)
+
+    def _refresh_state(self) -> bool:
+        """Cache the connectivity state and attributes from the device.
+
+        Returns True if anything changed since the last refresh.
+        """
+        device = self._device
+        is_on = device.rf_link_state == "ONLINE"
+        attributes = {key: getattr(device, key) for key in self._state_keys}
+        if (
+            is_on == self._attr_is_on
+            and attributes == self._attr_extra_state_attributes
+        ):
+            return False
+        self._attr_is_on = is_on
+        self._attr_extra_state_attributes = attributes
+        return True
+
+    @callback
+    def update_callback(self, _device: Any) -> None:
+        """Update the sensor state if the device data changed."""
+        if self._refresh_state():
+            self.async_write_ha_state()
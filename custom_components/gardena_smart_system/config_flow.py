@@ -1,8 +1,9 @@
 """Configuration flow for Gardena Smart System."""
 
 import asyncio
+import hashlib
 import logging
-from collections import OrderedDict
+import random
 
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
@@ -18,7 +19,10 @@ from .const import (
     DEFAULT_SMART_IRRIGATION_DURATION,
     DEFAULT_SMART_WATERING_DURATION,
     DOMAIN,
+    HTTP_FORBIDDEN,
+    HTTP_TOO_MANY_REQUESTS,
 )
+from .gardena.exceptions.authentication_exception import AuthenticationException
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,6 +40,98 @@ DEFAULT_OPTIONS = {
     CONF_SMART_WATERING_DURATION: DEFAULT_SMART_WATERING_DURATION,
 }
 
+# (option key, default value) pairs shown in the options form, in order
+OPTIONS_FIELDS = tuple(DEFAULT_OPTIONS.items())
+
+# (lowercase message fragment, form field, error code), checked in order
+_ERROR_PATTERNS = (
+    ("invalid_client", "application_key", "invalid_application_key"),
+    ("client not found", "application_key", "invalid_application_key"),
+    ("invalid_grant", "application_secret", "invalid_application_secret"),
+    ("access_denied", "base", "access_denied"),
+    ("timeout", "base", "timeout"),
+    ("simultaneous logins detected", "base", "simultaneous_logins"),
+    ("invalid_request", "base", "invalid_request"),
+)
+
+_RATE_LIMIT_MESSAGE = "Rate limit exceeded. Please wait and try again."
+_FORBIDDEN_MESSAGE = "Access forbidden. Check your API application configuration."
+_INVALID_CLIENT_MESSAGE = "Invalid Client ID or Client Secret"
+
+# (lowercase message fragment, exception type, message), checked in order
+_CONNECTION_ERRORS = (
+    ("rate limit", ConnectionError, _RATE_LIMIT_MESSAGE),
+    (str(HTTP_TOO_MANY_REQUESTS.value), ConnectionError, _RATE_LIMIT_MESSAGE),
+    (
+        "simultaneous logins",
+        ConnectionError,
+        "Multiple logins detected. Close other Gardena apps and try again.",
+    ),
+    (str(HTTP_FORBIDDEN.value), ConnectionError, _FORBIDDEN_MESSAGE),
+    ("forbidden", ConnectionError, _FORBIDDEN_MESSAGE),
+    ("not authorized", ConnectionError, _FORBIDDEN_MESSAGE),
+    ("invalid_client", AuthenticationException, _INVALID_CLIENT_MESSAGE),
+    ("client secret is invalid", AuthenticationException, _INVALID_CLIENT_MESSAGE),
+    (
+        "timeout",
+        ConnectionError,
+        "Connection timeout. Check your internet connection.",
+    ),
+)
+
+
+def _classify_error(error: Exception) -> tuple[str, str]:
+    """Return the form field and error code for a credential check failure."""
+    error_msg = str(error).lower()
+    for fragment, field, code in _ERROR_PATTERNS:
+        if fragment in error_msg:
+            return field, code
+    return "base", "auth"
+
+
+# OS-seeded random source for retry jitter
+_RANDOM = random.SystemRandom()
+
+# How long a successful credential check is reused, in seconds
+_TEST_CACHE_TTL = 30
+
+# (client_id, client_secret digest) -> future of the check result
+_test_cache: dict[tuple[str, str], asyncio.Future] = {}
+
+
+async def _run_once(client_id, client_secret, check):
+    """Run a credential check, sharing in-flight and recent successful results."""
+    # Never keep the plaintext secret around in the cache
+    secret_digest = hashlib.sha256(client_secret.encode()).hexdigest()
+    key = (client_id, secret_digest)
+    while (future := _test_cache.get(key)) is not None:
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # Only a cancelled check is retried, not our own cancellation
+            if not future.cancelled() or asyncio.current_task().cancelling():
+                raise
+
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    _test_cache[key] = future
+    try:
+        result = await check()
+    except asyncio.CancelledError:
+        _test_cache.pop(key, None)
+        future.cancel()
+        raise
+    except Exception as ex:
+        # Failures are not cached, only handed to concurrent waiters
+        _test_cache.pop(key, None)
+        future.set_exception(ex)
+        future.exception()  # Mark as retrieved when nobody is waiting
+        raise
+    future.set_result(result)
+    # Successful results are reused for a while after the check completes
+    loop.call_later(_TEST_CACHE_TTL, _test_cache.pop, key, None)
+    return result
+
 
 class GardenaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Gardena Smart System."""
@@ -45,14 +141,13 @@ class GardenaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def _show_setup_form(self, errors=None):
         """Show the setup form to the user."""
-        errors = errors or {}
-
-        fields = OrderedDict()
-        fields[vol.Required("application_key")] = str
-        fields[vol.Required("application_secret")] = str
-
         return self.async_show_form(
-            step_id="user", data_schema=vol.Schema(fields), errors=errors
+            step_id="user",
+            data_schema=CONFIG_SCHEMA,
+            errors=errors or {},
+            description_placeholders={
+                "docs_url": "https://developer.husqvarnagroup.cloud/",
+            },
         )
 
     async def async_step_user(self, user_input=None) -> FlowResult:
@@ -69,67 +164,56 @@ class GardenaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 )
             except Exception as ex:
                 _LOGGER.exception("Failed to validate credentials")
-                error_msg = str(ex).lower()
-
-                if "invalid_client" in error_msg or "client not found" in error_msg:
-                    errors["application_key"] = "invalid_application_key"
-                elif "invalid_grant" in error_msg:
-                    errors["application_secret"] = "invalid_application_secret"
-                elif "access_denied" in error_msg:
-                    errors["base"] = "access_denied"
-                elif "timeout" in error_msg:
-                    errors["base"] = "timeout"
-                elif "simultaneous logins detected" in error_msg:
-                    errors["base"] = "simultaneous_logins"
-                elif "invalid_request" in error_msg:
-                    errors["base"] = "invalid_request"
-                else:
-                    errors["base"] = "auth"
+                field, code = _classify_error(ex)
+                errors[field] = code
 
-        return self.async_show_form(
-            step_id="user",
-            data_schema=CONFIG_SCHEMA,
-            errors=errors,
-            description_placeholders={
-                "docs_url": "https://developer.husqvarnagroup.cloud/",
-            },
-        )
+        return await self._show_setup_form(errors)
 
     async def _test_credentials(self, config: dict) -> bool:
+        """Test if credentials are valid, reusing recent or in-flight checks."""
+        return await _run_once(
+            config["application_key"],
+            config["application_secret"],
+            lambda: self._check_credentials(config),
+        )
+
+    async def _check_credentials(self, config: dict) -> bool:
         """Test if credentials are valid with retry logic for simultaneous logins."""
         from .gardena.smart_system import SmartSystem
 
-        smart_system = SmartSystem(
-            client_id=config["application_key"],
-            client_secret=config["application_secret"],
-        )
-
         # Try multiple times with increasing delays for simultaneous login errors
         max_retries = 3
+        delay = 5
         for attempt in range(max_retries):
+            # Use a fresh instance so every attempt starts from a clean state
+            smart_system = SmartSystem(
+                client_id=config["application_key"],
+                client_secret=config["application_secret"],
+            )
             try:
-                # For retry attempts, completely reset the authentication state
-                if attempt > 0:
-                    await smart_system.quit()  # Clean up any existing state
-
                 await smart_system.authenticate()
                 await smart_system.quit()
                 return True
             except Exception as ex:
-                error_msg = str(ex).lower()
+                try:
+                    await smart_system.quit()
+                except Exception as quit_ex:
+                    _LOGGER.debug("Error during session cleanup: %s", quit_ex)
 
-                # If it's a simultaneous login error, wait and retry
+                # If it's a simultaneous login error, back off and retry
                 if (
-                    "simultaneous logins detected" in error_msg
+                    "simultaneous logins detected" in str(ex).lower()
                     and attempt < max_retries - 1
                 ):
+                    wait_time = delay + _RANDOM.uniform(0, delay / 2)
                     _LOGGER.warning(
-                        "Simultaneous login detected, waiting %d seconds before retry %d/%d",
-                        (attempt + 1) * 10,
+                        "Simultaneous login detected, waiting %.1f seconds before retry %d/%d",
+                        wait_time,
                         attempt + 2,
                         max_retries,
                     )
-                    await asyncio.sleep((attempt + 1) * 10)  # Wait 10, 20, 30 seconds
+                    await asyncio.sleep(wait_time)
+                    delay *= 2
                     continue
 
                 # For other errors or final retry, re-raise
@@ -161,31 +245,11 @@ class GardenaSmartSystemOptionsFlowHandler(config_entries.OptionsFlow):
             # TODO: Validate options (min, max values)
             return self.async_create_entry(title="", data=user_input)
 
-        fields = OrderedDict()
-        fields[
-            vol.Optional(
-                CONF_MOWER_DURATION,
-                default=self.config_entry.options.get(
-                    CONF_MOWER_DURATION, DEFAULT_MOWER_DURATION
-                ),
-            )
-        ] = cv.positive_int
-        fields[
-            vol.Optional(
-                CONF_SMART_IRRIGATION_DURATION,
-                default=self.config_entry.options.get(
-                    CONF_SMART_IRRIGATION_DURATION, DEFAULT_SMART_IRRIGATION_DURATION
-                ),
-            )
-        ] = cv.positive_int
-        fields[
-            vol.Optional(
-                CONF_SMART_WATERING_DURATION,
-                default=self.config_entry.options.get(
-                    CONF_SMART_WATERING_DURATION, DEFAULT_SMART_WATERING_DURATION
-                ),
-            )
-        ] = cv.positive_int
+        options = self.config_entry.options
+        fields = {
+            vol.Optional(key, default=options.get(key, default)): cv.positive_int
+            for key, default in OPTIONS_FIELDS
+        }
 
         return self.async_show_form(
             step_id="user", data_schema=vol.Schema(fields), errors=errors
@@ -195,7 +259,6 @@ class GardenaSmartSystemOptionsFlowHandler(config_entries.OptionsFlow):
 async def try_connection(client_id, client_secret) -> None:
     _LOGGER.debug("Trying to connect to Gardena during setup")
     # Import here to avoid circular imports at module level
-    from .gardena.exceptions.authentication_exception import AuthenticationException
     from .gardena.smart_system import SmartSystem
 
     smart_system = SmartSystem(client_id=client_id, client_secret=client_secret)
@@ -212,25 +275,9 @@ async def try_connection(client_id, client_secret) -> None:
         _LOGGER.exception("Connection test failed: %s", ex)
 
         # Handle specific error types
-        if "rate limit" in error_msg or "429" in error_msg:
-            msg = "Rate limit exceeded. Please wait and try again."
-            raise ConnectionError(msg) from ex
-        if "simultaneous logins" in error_msg:
-            msg = "Multiple logins detected. Close other Gardena apps and try again."
-            raise ConnectionError(msg) from ex
-        if (
-            "403" in error_msg
-            or "forbidden" in error_msg
-            or "not authorized" in error_msg
-        ):
-            msg = "Access forbidden. Check your API application configuration."
-            raise ConnectionError(msg) from ex
-        if "invalid_client" in error_msg or "client secret is invalid" in error_msg:
-            msg = "Invalid Client ID or Client Secret"
-            raise AuthenticationException(msg) from ex
-        if "timeout" in error_msg:
-            msg = "Connection timeout. Check your internet connection."
-            raise ConnectionError(msg) from ex
+        for fragment, error_type, msg in _CONNECTION_ERRORS:
+            if fragment in error_msg:
+                raise error_type(msg) from ex
 
         # Re-raise as ConnectionError for generic issues
         msg = f"Failed to connect to Gardena API: {ex}"
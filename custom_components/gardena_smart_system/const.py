@@ -1,8 +1,11 @@
 """Constants for the Gardena Smart System integration."""
 
+from http import HTTPStatus
+
 DOMAIN = "gardena_smart_system"
 GARDENA_SYSTEM = "gardena_system"
 GARDENA_LOCATION = "gardena_location"
+GARDENA_ENTRIES = "entries"  # entry_id -> GardenaEntryData
 
 # Additional constants for sensors
 ATTR_BATTERY_STATE = "battery_state"
@@ -28,11 +31,14 @@ ATTR_STINT_START = "stint_start"
 ATTR_STINT_END = "stint_end"
 
 # Add constants for rate limiting
-HTTP_TOO_MANY_REQUESTS = 429
-HTTP_NOT_FOUND = 404
-HTTP_UNAUTHORIZED = 401
-HTTP_FORBIDDEN = 403
+HTTP_TOO_MANY_REQUESTS = HTTPStatus.TOO_MANY_REQUESTS
+HTTP_NOT_FOUND = HTTPStatus.NOT_FOUND
+HTTP_UNAUTHORIZED = HTTPStatus.UNAUTHORIZED
+HTTP_FORBIDDEN = HTTPStatus.FORBIDDEN
 
 # Default delays for rate limiting
 DEFAULT_API_DELAY = 1.0  # Minimum delay between API calls
 RATE_LIMIT_DELAY = 60  # Delay when rate limited
+
+# Cooldown for coalescing bursts of device push updates into one state write
+UPDATE_DEBOUNCE_COOLDOWN = 0.25
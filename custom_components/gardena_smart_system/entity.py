@@ -0,0 +1,62 @@
+"""Base entity for Gardena Smart System devices."""
+
+import logging
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.entity import Entity
+
+from .const import UPDATE_DEBOUNCE_COOLDOWN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class GardenaDebouncedEntity(Entity):
+    """Base class for entities that coalesce device updates into state writes.
+
+    Subclasses set ``self._device`` and implement ``_refresh_attributes``.
+    """
+
+    _attr_should_poll = False
+
+    _device: Any
+    _debouncer: Debouncer | None = None
+    _added = False
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to device updates."""
+        self._debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=UPDATE_DEBOUNCE_COOLDOWN,
+            immediate=True,
+            function=self._async_refresh,
+        )
+        self._device.add_callback(self.update_callback)
+        self._added = True
+        # Seed the state from the data the library already holds
+        self.update_callback(self._device)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Unsubscribe from device updates."""
+        self._added = False
+        self._device.remove_callback(self.update_callback)
+        self._debouncer.async_shutdown()
+
+    @callback
+    def update_callback(self, _device: Any) -> None:
+        """Coalesce device updates into state writes."""
+        if not self._added:
+            return
+        self._debouncer.async_schedule_call()
+
+    @callback
+    def _async_refresh(self) -> None:
+        """Rebuild the cached state and write it."""
+        self._refresh_attributes()
+        self.async_write_ha_state()
+
+    def _refresh_attributes(self) -> None:
+        """Rebuild the cached state attributes from the device."""
+        raise NotImplementedError
@@ -1,17 +1,57 @@
 """Base device class for Gardena Smart System devices."""
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
+from random import getrandbits
 
 from ..base_gardena_class import BaseGardenaClass
 
 
+def _req_id() -> str:
+    """Return an opaque random id for a command request."""
+    return f"{getrandbits(128):032x}"
+
+
 class BaseDevice(BaseGardenaClass):
     """Base class informations about gardena devices."""
 
+    __slots__ = (
+        "_call_service",
+        "_duration_cache",
+        "battery_level",
+        "battery_state",
+        "callbacks",
+        "id",
+        "location",
+        "model_type",
+        "name",
+        "rf_link_level",
+        "rf_link_state",
+        "serial",
+        "type",
+    )
+
+    # Type of the control commands sent to this device
+    _CONTROL_TYPE: str | None = None
+
+    # Message types handled by update_device_specific_data
+    _SPECIFIC_TYPES: frozenset[str] = frozenset()
+
+    # (field name, API attribute name) pairs shared by all device types
+    _COMMON_FIELDS = (
+        ("battery_level", "batteryLevel"),
+        ("battery_state", "batteryState"),
+        ("name", "name"),
+        ("rf_link_level", "rfLinkLevel"),
+        ("rf_link_state", "rfLinkState"),
+        ("serial", "serial"),
+        ("model_type", "modelType"),
+    )
+
     def __init__(self, location, device_id) -> None:
         """Initialize the BaseDevice."""
         self.location = location
         self.id = device_id
+        self._call_service = location.smart_system.call_smart_system_service
         self.type = "N/A"
         self.battery_level = "N/A"
         self.battery_state = "N/A"
@@ -20,7 +60,14 @@ class BaseDevice(BaseGardenaClass):
         self.rf_link_state = "N/A"
         self.serial = "N/A"
         self.model_type = "N/A"
-        self.callbacks = []
+        self.callbacks = set()
+        # field prefix -> ((timestamp, duration), deadline) of the last duration
+        self._duration_cache = {}
+
+    @classmethod
+    def declares(cls, field: str) -> bool:
+        """Return True if the device class declares the given data field."""
+        return any(field in getattr(klass, "__slots__", ()) for klass in cls.__mro__)
 
     def setup_values_from_device_map(self, device_map) -> None:
         """Set up initial values from device map."""
@@ -30,40 +77,46 @@ class BaseDevice(BaseGardenaClass):
 
     def add_callback(self, callback) -> None:
         """Add a callback for data updates."""
-        self.callbacks.append(callback)
+        self.callbacks.add(callback)
+
+    def remove_callback(self, callback) -> None:
+        """Remove a previously added callback."""
+        self.callbacks.discard(callback)
 
     def update_data(self, device_map) -> None:
         """Update device data from device map."""
-        if device_map["type"] == "COMMON":
+        message_type = device_map["type"]
+        if message_type == "COMMON":
             self.update_common_data(device_map)
-        self.update_device_specific_data(device_map)
-        for callback in self.callbacks:
+        elif message_type in self._SPECIFIC_TYPES:
+            self.update_device_specific_data(device_map)
+        else:
+            # Nothing this device tracks changed, skip the callback fanout
+            return
+        # Iterate a snapshot so callbacks may (un)register during fanout
+        for callback in tuple(self.callbacks):
             callback(self)
 
     def update_common_data(self, common_map) -> None:
         """Update common device data."""
-        self.set_attribute_value("battery_level", common_map, "batteryLevel")
-        self.set_attribute_value("battery_state", common_map, "batteryState")
-        self.set_attribute_value("name", common_map, "name")
-        self.set_attribute_value("rf_link_level", common_map, "rfLinkLevel")
-        self.set_attribute_value("rf_link_state", common_map, "rfLinkState")
-        self.set_attribute_value("serial", common_map, "serial")
-        self.set_attribute_value("model_type", common_map, "modelType")
+        attrs = common_map["attributes"]
+        for field_name, attribute_name in self._COMMON_FIELDS:
+            entry = attrs.get(attribute_name)
+            if entry is not None:
+                setattr(self, field_name, entry["value"])
 
     def set_attribute_value(self, field_name, attributes_map, attribute_name) -> None:
         """Set a single attribute value from the attributes map."""
-        if attribute_name in attributes_map["attributes"]:
-            setattr(
-                self, field_name, attributes_map["attributes"][attribute_name]["value"]
-            )
+        entry = attributes_map["attributes"].get(attribute_name)
+        if entry is not None:
+            setattr(self, field_name, entry["value"])
 
     def set_duration_attributes(
         self, field_prefix, attributes_map, attribute_name
     ) -> None:
         """Set duration-related attributes including timestamp, value, and remaining time."""
-        if attribute_name in attributes_map["attributes"]:
-            duration_data = attributes_map["attributes"][attribute_name]
-
+        duration_data = attributes_map["attributes"].get(attribute_name)
+        if duration_data is not None:
             # Set the main duration value
             setattr(self, f"{field_prefix}_duration", duration_data.get("value", "N/A"))
 
@@ -75,10 +128,10 @@ class BaseDevice(BaseGardenaClass):
             )
 
             # Calculate remaining time if we have both value and timestamp
-            remaining_time = self._calculate_remaining_time(duration_data)
+            remaining_time = self._calculate_remaining_time(duration_data, field_prefix)
             setattr(self, f"{field_prefix}_remaining_time", remaining_time)
 
-    def _calculate_remaining_time(self, duration_data):
+    def _calculate_remaining_time(self, duration_data, field_prefix=None):
         """Calculate remaining time based on duration value and timestamp."""
         try:
             if "value" not in duration_data or "timestamp" not in duration_data:
@@ -93,22 +146,34 @@ class BaseDevice(BaseGardenaClass):
             if not timestamp_str:
                 return "N/A"
 
-            # Parse ISO 8601 timestamp
-            start_time = datetime.fromisoformat(timestamp_str)
-            current_time = datetime.now(UTC)
-
-            # Calculate elapsed time
-            elapsed_seconds = (current_time - start_time).total_seconds()
+            # Reuse the deadline if this duration was seen before
+            key = (timestamp_str, duration_seconds)
+            cached = self._duration_cache.get(field_prefix)
+            if cached is not None and cached[0] == key:
+                deadline = cached[1]
+            else:
+                # Parse ISO 8601 timestamp
+                start_time = datetime.fromisoformat(timestamp_str)
+                deadline = start_time + timedelta(seconds=duration_seconds)
+                self._duration_cache[field_prefix] = (key, deadline)
 
             # Calculate remaining time
-            remaining_seconds = max(0, duration_seconds - elapsed_seconds)
-
-            return int(remaining_seconds)
+            remaining_seconds = (deadline - datetime.now(UTC)).total_seconds()
+            return int(max(0, remaining_seconds))
 
         except (ValueError, TypeError, AttributeError):
             # If any calculation fails, return N/A
             return "N/A"
 
+    async def _send(self, target_id, command, **extra) -> None:
+        """Send a control command with optional extra attributes."""
+        data = {
+            "id": _req_id(),
+            "type": self._CONTROL_TYPE,
+            "attributes": {"command": command, **extra},
+        }
+        await self._call_service(target_id, data)
+
     def update_device_specific_data(self, device_map) -> None:
         """
         Update device-specific data.
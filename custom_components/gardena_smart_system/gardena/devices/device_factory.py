@@ -5,20 +5,24 @@ from .smart_irrigation_control import SmartIrrigationControl
 from .soil_sensor import SoilSensor
 from .water_control import WaterControl
 
+# Service types that map to exactly one device class
+_SIMPLE_TYPES = {"MOWER": Mower, "POWER_SOCKET": PowerSocket}
+
 
 class DeviceFactory:
     @staticmethod
     def build(location, device_map):
-        if "MOWER" in device_map:
-            return Mower(location, device_map)
-        if "SENSOR" in device_map:
-            if "ambientTemperature" in device_map["SENSOR"][0]["attributes"]:
+        for service_type, device_class in _SIMPLE_TYPES.items():
+            if service_type in device_map:
+                return device_class(location, device_map)
+        sensors = device_map.get("SENSOR")
+        if sensors is not None:
+            if "ambientTemperature" in sensors[0]["attributes"]:
                 return Sensor(location, device_map)
             return SoilSensor(location, device_map)
-        if "POWER_SOCKET" in device_map:
-            return PowerSocket(location, device_map)
-        if "VALVE" in device_map:
-            if len(device_map["VALVE"]) > 1:
+        valves = device_map.get("VALVE")
+        if valves is not None:
+            if len(valves) > 1:
                 return SmartIrrigationControl(location, device_map)
             return WaterControl(location, device_map)
         return None
@@ -1,13 +1,24 @@
 """Mower device for Gardena Smart System."""
 
-import uuid
-
 from .base_device import BaseDevice
 
 
 class Mower(BaseDevice):
     """Mower device for smart lawn cutting operations."""
 
+    __slots__ = (
+        "activity",
+        "last_error_code",
+        "mower_id",
+        "mowing_duration",
+        "mowing_duration_timestamp",
+        "mowing_remaining_time",
+        "operating_hours",
+        "state",
+    )
+    _CONTROL_TYPE = "MOWER_CONTROL"
+    _SPECIFIC_TYPES = frozenset({"MOWER"})
+
     def __init__(self, location, device_map) -> None:
         """Initialize the mower device."""
         BaseDevice.__init__(self, location, device_map["COMMON"][0]["id"])
@@ -38,61 +49,25 @@ class Mower(BaseDevice):
             # Duration attributes for mowing operations
             self.set_duration_attributes("mowing", device_map, "mowingDuration")
 
-    async def start_seconds_to_override(self, duration) -> None:
-        """Start mowing override operation for specified duration in seconds."""
+    async def _send_to_mower(self, command, **extra) -> None:
+        """Send a control command to the mower service."""
         if self.mower_id is not None:
-            data = {
-                "id": str(uuid.uuid1()),
-                "type": "MOWER_CONTROL",
-                "attributes": {
-                    "command": "START_SECONDS_TO_OVERRIDE",
-                    "seconds": duration,
-                },
-            }
-            await self.location.smart_system.call_smart_system_service(
-                self.mower_id, data
-            )
+            await self._send(self.mower_id, command, **extra)
         else:
             self.location.smart_system.logger.error("The mower id is not defined")
 
+    async def start_seconds_to_override(self, duration) -> None:
+        """Start mowing override operation for specified duration in seconds."""
+        await self._send_to_mower("START_SECONDS_TO_OVERRIDE", seconds=duration)
+
     async def start_dont_override(self) -> None:
         """Start mowing without overriding the schedule."""
-        if self.mower_id is not None:
-            data = {
-                "id": str(uuid.uuid1()),
-                "type": "MOWER_CONTROL",
-                "attributes": {"command": "START_DONT_OVERRIDE"},
-            }
-            await self.location.smart_system.call_smart_system_service(
-                self.mower_id, data
-            )
-        else:
-            self.location.smart_system.logger.error("The mower id is not defined")
+        await self._send_to_mower("START_DONT_OVERRIDE")
 
     async def park_until_next_task(self) -> None:
         """Park mower until next scheduled task."""
-        if self.mower_id is not None:
-            data = {
-                "id": str(uuid.uuid1()),
-                "type": "MOWER_CONTROL",
-                "attributes": {"command": "PARK_UNTIL_NEXT_TASK"},
-            }
-            await self.location.smart_system.call_smart_system_service(
-                self.mower_id, data
-            )
-        else:
-            self.location.smart_system.logger.error("The mower id is not defined")
+        await self._send_to_mower("PARK_UNTIL_NEXT_TASK")
 
     async def park_until_further_notice(self) -> None:
         """Park mower until manually restarted."""
-        if self.mower_id is not None:
-            data = {
-                "id": str(uuid.uuid1()),
-                "type": "MOWER_CONTROL",
-                "attributes": {"command": "PARK_UNTIL_FURTHER_NOTICE"},
-            }
-            await self.location.smart_system.call_smart_system_service(
-                self.mower_id, data
-            )
-        else:
-            self.location.smart_system.logger.error("The mower id is not defined")
+        await self._send_to_mower("PARK_UNTIL_FURTHER_NOTICE")
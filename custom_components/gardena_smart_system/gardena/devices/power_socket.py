@@ -1,13 +1,22 @@
 """Power socket device for Gardena Smart System."""
 
-import uuid
-
 from .base_device import BaseDevice
 
 
 class PowerSocket(BaseDevice):
     """Power socket device for smart power control."""
 
+    __slots__ = (
+        "activity",
+        "last_error_code",
+        "override_duration",
+        "override_duration_timestamp",
+        "override_remaining_time",
+        "state",
+    )
+    _CONTROL_TYPE = "POWER_SOCKET_CONTROL"
+    _SPECIFIC_TYPES = frozenset({"POWER_SOCKET"})
+
     def __init__(self, location, device_map) -> None:
         """Initialize the Power socket device."""
         BaseDevice.__init__(self, location, device_map["COMMON"][0]["id"])
@@ -36,45 +45,20 @@ class PowerSocket(BaseDevice):
 
     async def start_seconds_to_override(self, duration) -> None:
         """Start override operation for specified duration in seconds."""
-        data = {
-            "id": str(uuid.uuid1()),
-            "type": "POWER_SOCKET_CONTROL",
-            "attributes": {"command": "START_SECONDS_TO_OVERRIDE", "seconds": duration},
-        }
-        await self.location.smart_system.call_smart_system_service(self.id, data)
+        await self._send(self.id, "START_SECONDS_TO_OVERRIDE", seconds=duration)
 
     async def start_override(self) -> None:
         """Start override operation without duration limit."""
-        data = {
-            "id": str(uuid.uuid1()),
-            "type": "POWER_SOCKET_CONTROL",
-            "attributes": {"command": "START_OVERRIDE"},
-        }
-        await self.location.smart_system.call_smart_system_service(self.id, data)
+        await self._send(self.id, "START_OVERRIDE")
 
     async def stop_until_next_task(self) -> None:
         """Stop until next scheduled task."""
-        data = {
-            "id": str(uuid.uuid1()),
-            "type": "POWER_SOCKET_CONTROL",
-            "attributes": {"command": "STOP_UNTIL_NEXT_TASK"},
-        }
-        await self.location.smart_system.call_smart_system_service(self.id, data)
+        await self._send(self.id, "STOP_UNTIL_NEXT_TASK")
 
     async def pause(self) -> None:
         """Pause the power socket operation."""
-        data = {
-            "id": str(uuid.uuid1()),
-            "type": "POWER_SOCKET_CONTROL",
-            "attributes": {"command": "PAUSE"},
-        }
-        await self.location.smart_system.call_smart_system_service(self.id, data)
+        await self._send(self.id, "PAUSE")
 
     async def unpause(self) -> None:
         """Resume the power socket operation."""
-        data = {
-            "id": str(uuid.uuid1()),
-            "type": "POWER_SOCKET_CONTROL",
-            "attributes": {"command": "UNPAUSE"},
-        }
-        await self.location.smart_system.call_smart_system_service(self.id, data)
+        await self._send(self.id, "UNPAUSE")
@@ -2,6 +2,14 @@ from .base_device import BaseDevice
 
 
 class Sensor(BaseDevice):
+    __slots__ = (
+        "ambient_temperature",
+        "light_intensity",
+        "soil_humidity",
+        "soil_temperature",
+    )
+    _SPECIFIC_TYPES = frozenset({"SENSOR"})
+
     def __init__(self, location, device_map) -> None:
         """Constructor for the sensor device."""
         BaseDevice.__init__(self, location, device_map["COMMON"][0]["id"])
@@ -1,9 +1,46 @@
-import uuid
+import asyncio
+import logging
+import time
+from datetime import UTC, datetime
 
 from .base_device import BaseDevice
 
+_LOGGER = logging.getLogger(__name__)
+
+# Attribute names that may carry valve duration data, in priority order
+_DURATION_FIELDS = (
+    "valveDuration",
+    "duration",
+    "watering_duration",
+    "remainingTime",
+    "remaining_time",
+    "watering_time",
+    "schedule_duration",
+    "timer",
+)
+_DURATION_FIELDS_SET = frozenset(_DURATION_FIELDS)
+
+# Valve activities that mean the valve is currently watering
+_ACTIVE_ACTIVITIES = frozenset({"MANUAL_WATERING", "SCHEDULED_WATERING"})
+
 
 class SmartIrrigationControl(BaseDevice):
+    __slots__ = (
+        "_active_valves",
+        "_deadlines",
+        "_ts_cache",
+        "valve_duration",
+        "valve_duration_timestamp",
+        "valve_durations",
+        "valve_remaining_time",
+        "valve_set_id",
+        "valve_set_last_error_code",
+        "valve_set_state",
+        "valves",
+    )
+    _CONTROL_TYPE = "VALVE_CONTROL"
+    _SPECIFIC_TYPES = frozenset({"VALVE", "VALVE_SET"})
+
     def __init__(self, location, device_map) -> None:
         """Constructor for the smart irrigation control device."""
         BaseDevice.__init__(self, location, device_map["COMMON"][0]["id"])
@@ -15,6 +52,10 @@ class SmartIrrigationControl(BaseDevice):
 
         # Duration attributes per valve - will be populated when valves are created
         self.valve_durations = {}  # valve_id -> duration info
+        self._ts_cache = {}  # ISO timestamp string -> parsed datetime
+        self._active_valves = set()  # ids of valves with was_active set
+        # valve_id -> ((timestamp, duration), monotonic deadline)
+        self._deadlines = {}
 
         # Device-level duration attributes (for compatibility with existing sensor code)
         self.valve_duration = "N/A"
@@ -33,6 +74,55 @@ class SmartIrrigationControl(BaseDevice):
         else:
             target_map[value_name_in_target] = "N/A"
 
+    def _parse_timestamp(self, timestamp):
+        """Parse an ISO 8601 timestamp, reusing earlier results."""
+        parsed = self._ts_cache.get(timestamp)
+        if parsed is None:
+            parsed = self._ts_cache[timestamp] = datetime.fromisoformat(timestamp)
+        return parsed
+
+    def _valve_remaining_time(
+        self, valve_id: str, duration_seconds: int, start_timestamp: str, now
+    ) -> int:
+        """Return the remaining watering time of an active valve in seconds.
+
+        Once known for a run of the valve, the remaining time is derived from
+        a monotonic deadline instead of re-parsing the start timestamp.
+        """
+        try:
+            run_key = (start_timestamp, duration_seconds)
+            cached = self._deadlines.get(valve_id)
+            if cached is not None and cached[0] == run_key:
+                remaining_seconds = max(0, int(cached[1] - time.monotonic()))
+                elapsed_seconds = duration_seconds - remaining_seconds
+            else:
+                start_time = self._parse_timestamp(start_timestamp)
+                elapsed_seconds = int((now - start_time).total_seconds())
+                remaining_seconds = max(0, duration_seconds - elapsed_seconds)
+                self._deadlines[valve_id] = (
+                    run_key,
+                    time.monotonic() + remaining_seconds,
+                )
+        except Exception as e:
+            _LOGGER.debug("Error parsing duration timestamp: %s", e)
+            return 0  # Default to 0 if calculation fails
+
+        _LOGGER.debug(
+            "Parsed duration for valve %s: total=%ds, elapsed=%ds, remaining=%ds",
+            valve_id,
+            duration_seconds,
+            elapsed_seconds,
+            remaining_seconds,
+        )
+        return remaining_seconds
+
+    def _evict_timestamp(self, valve_id) -> None:
+        """Drop the cached start time of a valve that stopped watering."""
+        self._deadlines.pop(valve_id, None)
+        valve_info = self.valve_durations.get(valve_id)
+        if valve_info is not None:
+            self._ts_cache.pop(valve_info.get("timestamp"), None)
+
     def update_device_specific_data(self, device_map) -> None:
         if device_map["type"] == "VALVE_SET":
             # SmartIrrigationControl has only one item
@@ -42,172 +132,101 @@ class SmartIrrigationControl(BaseDevice):
                 "valve_set_last_error_code", device_map, "lastErrorCode"
             )
         if device_map["type"] == "VALVE":
+            # One time snapshot for all duration calculations of this update
+            now = datetime.now(UTC)
             valve_id = device_map["id"]
-            self.valves[valve_id] = {"id": valve_id}
+            valve_entry = self.valves[valve_id] = {"id": valve_id}
+            attrs = device_map.get("attributes", {})
 
             # Debug: Log all available data for valve to find duration
-            import logging
-
-            logger = logging.getLogger(__name__)
-            logger.debug("VALVE DEBUG - Processing valve %s", valve_id)
-            logger.debug("VALVE DEBUG - Complete device_map structure: %s", device_map)
-            logger.debug(
-                "VALVE DEBUG - Available attributes: %s",
-                list(device_map.get("attributes", {}).keys()),
-            )
-            if "attributes" in device_map:
-                for attr_name, attr_data in device_map["attributes"].items():
-                    if "duration" in attr_name.lower() or "time" in attr_name.lower():
-                        logger.debug(
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("VALVE DEBUG - Processing valve %s", valve_id)
+                _LOGGER.debug(
+                    "VALVE DEBUG - Complete device_map structure: %s", device_map
+                )
+                _LOGGER.debug("VALVE DEBUG - Available attributes: %s", list(attrs))
+                for attr_name, attr_data in attrs.items():
+                    lower_name = attr_name.lower()
+                    if "duration" in lower_name or "time" in lower_name:
+                        _LOGGER.debug(
                             "VALVE DEBUG - Found time/duration attribute: %s = %s",
                             attr_name,
                             attr_data,
                         )
-                    logger.debug("VALVE DEBUG - Attribute %s: %s", attr_name, attr_data)
+                    _LOGGER.debug(
+                        "VALVE DEBUG - Attribute %s: %s", attr_name, attr_data
+                    )
 
+            self._set_valves_map_value(valve_entry, attrs, "activity")
             self._set_valves_map_value(
-                self.valves[device_map["id"]], device_map["attributes"], "activity"
-            )
-            self._set_valves_map_value(
-                self.valves[device_map["id"]],
-                device_map["attributes"],
-                "lastErrorCode",
-                "last_error_code",
-            )
-            self._set_valves_map_value(
-                self.valves[device_map["id"]], device_map["attributes"], "name"
-            )
-            self._set_valves_map_value(
-                self.valves[device_map["id"]], device_map["attributes"], "state"
+                valve_entry, attrs, "lastErrorCode", "last_error_code"
             )
+            self._set_valves_map_value(valve_entry, attrs, "name")
+            self._set_valves_map_value(valve_entry, attrs, "state")
 
             # Look for duration information in various possible API fields
             duration_found = False
-            if "attributes" in device_map:
-                # Check for various possible duration field names from API
-                possible_duration_fields = [
-                    "valveDuration",
-                    "duration",
-                    "watering_duration",
-                    "remainingTime",
-                    "remaining_time",
-                    "watering_time",
-                    "schedule_duration",
-                    "timer",
-                ]
-
-                for field_name in possible_duration_fields:
-                    if field_name in device_map["attributes"]:
-                        # Found API duration data - but only use it if valve is active
-                        duration_data = device_map["attributes"][field_name]
-
-                        # Check if valve is currently active
-                        valve_activity = (
-                            device_map.get("attributes", {})
-                            .get("activity", {})
-                            .get("value", "CLOSED")
-                        )
-                        is_valve_active = valve_activity in [
-                            "MANUAL_WATERING",
-                            "SCHEDULED_WATERING",
-                        ]
-
-                        if (
-                            isinstance(duration_data, dict)
-                            and "value" in duration_data
-                            and "timestamp" in duration_data
-                            and is_valve_active  # Only process duration if valve is active
-                        ):
-                            # Extract duration value and timestamp
-                            duration_seconds = duration_data["value"]
-                            start_timestamp = duration_data["timestamp"]
-
-                            # Calculate remaining time
-                            import datetime
-
-                            try:
-                                start_time = datetime.datetime.fromisoformat(
-                                    start_timestamp
-                                )
-                                current_time = datetime.datetime.now(datetime.UTC)
-                                elapsed_seconds = int(
-                                    (current_time - start_time).total_seconds()
-                                )
-                                remaining_seconds = max(
-                                    0, duration_seconds - elapsed_seconds
-                                )
-
-                                # Set the duration attributes per valve AND globally (as numbers)
-                                self.valve_duration = duration_seconds
-                                self.valve_duration_timestamp = start_timestamp
-                                self.valve_remaining_time = remaining_seconds
-
-                                # IMPORTANT: Also set duration attributes on this specific valve
-                                if valve_id not in self.valve_durations:
-                                    self.valve_durations[valve_id] = {}
-                                self.valve_durations[valve_id].update(
-                                    {
-                                        "duration": duration_seconds,  # Store as number (seconds)
-                                        "timestamp": start_timestamp,
-                                        "remaining_time": remaining_seconds,  # Store as number (seconds)
-                                        "was_active": True,
-                                    }
-                                )
-
-                                logger.debug(
-                                    "Parsed duration for valve %s: total=%ds, elapsed=%ds, remaining=%ds",
-                                    valve_id,
-                                    duration_seconds,
-                                    elapsed_seconds,
-                                    remaining_seconds,
-                                )
-                            except Exception as e:
-                                logger.debug("Error parsing duration timestamp: %s", e)
-                                self.valve_duration = duration_seconds
-                                self.valve_duration_timestamp = start_timestamp
-                                self.valve_remaining_time = (
-                                    0  # Default to 0 if calculation fails
-                                )
-                        elif (
-                            isinstance(duration_data, dict)
-                            and "value" in duration_data
-                            and "timestamp" in duration_data
-                            and not is_valve_active  # Valve is NOT active but has duration data
-                        ):
+            if attrs:
+                # Check for various possible duration field names from API,
+                # taking the first one in priority order
+                matches = _DURATION_FIELDS_SET & attrs.keys()
+                field_name = next(
+                    (name for name in _DURATION_FIELDS if name in matches), None
+                )
+                if field_name is not None:
+                    # Found API duration data - but only use it if valve is active
+                    duration_data = attrs[field_name]
+
+                    # Check if valve is currently active
+                    valve_activity = attrs.get("activity", {}).get("value", "CLOSED")
+                    is_valve_active = valve_activity in _ACTIVE_ACTIVITIES
+
+                    try:
+                        duration_seconds = duration_data["value"]
+                        start_timestamp = duration_data["timestamp"]
+                    except (KeyError, TypeError):
+                        # Fallback for other duration formats
+                        self.set_duration_attributes("valve", device_map, field_name)
+                    else:
+                        if is_valve_active:
+                            remaining_seconds = self._valve_remaining_time(
+                                valve_id, duration_seconds, start_timestamp, now
+                            )
+                            self._active_valves.add(valve_id)
+                        else:
                             # Valve is not active - clear duration attributes
-                            if valve_id not in self.valve_durations:
-                                self.valve_durations[valve_id] = {}
-                            self.valve_durations[valve_id].update(
-                                {
-                                    "duration": 0,  # Clear duration when inactive
-                                    "timestamp": "N/A",
-                                    "remaining_time": 0,  # Clear remaining time when inactive
-                                    "was_active": False,
-                                }
+                            duration_seconds, start_timestamp, remaining_seconds = (
+                                0,
+                                "N/A",
+                                0,
                             )
-                            # Also clear device-level attributes
-                            self.valve_duration = 0
-                            self.valve_duration_timestamp = "N/A"
-                            self.valve_remaining_time = 0
-
-                            logger.debug(
+                            self._evict_timestamp(valve_id)
+                            self._active_valves.discard(valve_id)
+                            _LOGGER.debug(
                                 "Valve %s is inactive - cleared duration attributes",
                                 valve_id,
                             )
-                        else:
-                            # Fallback for other duration formats
-                            self.set_duration_attributes(
-                                "valve", device_map, field_name
-                            )
 
-                        duration_found = True
-                        logger.debug(
-                            "Found API duration data in field %s for valve %s: %s",
-                            field_name,
-                            valve_id,
-                            duration_data,
+                        # Set the duration attributes per valve AND globally (as numbers)
+                        self.valve_durations.setdefault(valve_id, {}).update(
+                            {
+                                "duration": duration_seconds,
+                                "timestamp": start_timestamp,
+                                "remaining_time": remaining_seconds,
+                                "was_active": is_valve_active,
+                            }
                         )
-                        break
+                        self.valve_duration = duration_seconds
+                        self.valve_duration_timestamp = start_timestamp
+                        self.valve_remaining_time = remaining_seconds
+
+                    duration_found = True
+                    _LOGGER.debug(
+                        "Found API duration data in field %s for valve %s: %s",
+                        field_name,
+                        valve_id,
+                        duration_data,
+                    )
 
                 # Also check for timestamp fields that might indicate duration
                 timestamp_fields = [
@@ -217,22 +236,17 @@ class SmartIrrigationControl(BaseDevice):
                     "operation_start",
                 ]
                 for field_name in timestamp_fields:
-                    if field_name in device_map["attributes"]:
-                        logger.debug(
+                    if field_name in attrs:
+                        _LOGGER.debug(
                             "Found timestamp field %s for valve %s: %s",
                             field_name,
                             valve_id,
-                            device_map["attributes"][field_name],
+                            attrs[field_name],
                         )
 
             # If no API duration found, implement simple local tracking
             if not duration_found:
-                valve_id = device_map["id"]
-                activity = (
-                    device_map.get("attributes", {})
-                    .get("activity", {})
-                    .get("value", "CLOSED")
-                )
+                activity = attrs.get("activity", {}).get("value", "CLOSED")
 
                 # Initialize duration tracking for this valve if not exists
                 if valve_id not in self.valve_durations:
@@ -245,22 +259,16 @@ class SmartIrrigationControl(BaseDevice):
 
                 # Track when valve becomes active
                 valve_info = self.valve_durations[valve_id]
-                is_currently_active = activity in [
-                    "MANUAL_WATERING",
-                    "SCHEDULED_WATERING",
-                ]
+                is_currently_active = activity in _ACTIVE_ACTIVITIES
 
                 if is_currently_active and not valve_info["was_active"]:
                     # Valve just became active - start tracking
-                    import datetime
-
-                    valve_info["timestamp"] = datetime.datetime.now(
-                        datetime.UTC
-                    ).isoformat()
+                    valve_info["timestamp"] = now.isoformat()
                     valve_info["duration"] = 0  # No API duration available yet
                     valve_info["remaining_time"] = 0  # No remaining time yet
                     valve_info["was_active"] = True
-                    logger.debug(
+                    self._active_valves.add(valve_id)
+                    _LOGGER.debug(
                         "Started local tracking for valve %s at %s",
                         valve_id,
                         valve_info["timestamp"],
@@ -268,47 +276,35 @@ class SmartIrrigationControl(BaseDevice):
 
                 elif not is_currently_active and valve_info["was_active"]:
                     # Valve just became inactive - clear duration and remaining time
-                    import datetime
-
                     if valve_info["timestamp"] != "N/A":
                         try:
-                            start_time = datetime.datetime.fromisoformat(
-                                valve_info["timestamp"]
-                            )
-                            end_time = datetime.datetime.now(datetime.UTC)
-                            duration_seconds = int(
-                                (end_time - start_time).total_seconds()
-                            )
-                            logger.debug(
+                            start_time = self._parse_timestamp(valve_info["timestamp"])
+                            duration_seconds = int((now - start_time).total_seconds())
+                            _LOGGER.debug(
                                 "Valve %s finished watering, final duration: %s seconds",
                                 valve_id,
                                 duration_seconds,
                             )
                         except Exception as e:
-                            logger.debug(
+                            _LOGGER.debug(
                                 "Error calculating final duration for valve %s: %s",
                                 valve_id,
                                 e,
                             )
 
                     # Reset duration attributes when valve becomes inactive
+                    self._evict_timestamp(valve_id)
                     valve_info["duration"] = 0
                     valve_info["timestamp"] = "N/A"
                     valve_info["remaining_time"] = 0
                     valve_info["was_active"] = False
+                    self._active_valves.discard(valve_id)
                 elif is_currently_active and valve_info["was_active"]:
                     # Valve is still active - update remaining time
-                    import datetime
-
                     if valve_info["timestamp"] != "N/A":
                         try:
-                            start_time = datetime.datetime.fromisoformat(
-                                valve_info["timestamp"]
-                            )
-                            current_time = datetime.datetime.now(datetime.UTC)
-                            elapsed_seconds = int(
-                                (current_time - start_time).total_seconds()
-                            )
+                            start_time = self._parse_timestamp(valve_info["timestamp"])
+                            elapsed_seconds = int((now - start_time).total_seconds())
                             valve_info["remaining_time"] = (
                                 elapsed_seconds  # Show elapsed time
                             )
@@ -316,13 +312,10 @@ class SmartIrrigationControl(BaseDevice):
                             valve_info["remaining_time"] = 0
 
                 # Set device-level attributes based on any active valve
-                active_valve_info = None
-                for vinfo in self.valve_durations.values():
-                    if vinfo["was_active"]:
-                        active_valve_info = vinfo
-                        break
-
-                if active_valve_info:
+                if self._active_valves:
+                    active_valve_info = self.valve_durations[
+                        next(iter(self._active_valves))
+                    ]
                     self.valve_duration = active_valve_info["duration"]
                     self.valve_duration_timestamp = active_valve_info["timestamp"]
                     self.valve_remaining_time = active_valve_info["remaining_time"]
@@ -332,33 +325,21 @@ class SmartIrrigationControl(BaseDevice):
                     self.valve_remaining_time = 0
 
     async def start_seconds_to_override(self, duration, valve_id) -> None:
-        data = {
-            "id": str(uuid.uuid1()),
-            "type": "VALVE_CONTROL",
-            "attributes": {"command": "START_SECONDS_TO_OVERRIDE", "seconds": duration},
-        }
-        await self.location.smart_system.call_smart_system_service(valve_id, data)
+        await self._send(valve_id, "START_SECONDS_TO_OVERRIDE", seconds=duration)
 
     async def stop_until_next_task(self, valve_id) -> None:
-        data = {
-            "id": str(uuid.uuid1()),
-            "type": "VALVE_CONTROL",
-            "attributes": {"command": "STOP_UNTIL_NEXT_TASK"},
-        }
-        await self.location.smart_system.call_smart_system_service(valve_id, data)
+        await self._send(valve_id, "STOP_UNTIL_NEXT_TASK")
 
     async def pause(self, valve_id) -> None:
-        data = {
-            "id": str(uuid.uuid1()),
-            "type": "VALVE_CONTROL",
-            "attributes": {"command": "PAUSE"},
-        }
-        await self.location.smart_system.call_smart_system_service(valve_id, data)
+        await self._send(valve_id, "PAUSE")
 
     async def unpause(self, valve_id) -> None:
-        data = {
-            "id": str(uuid.uuid1()),
-            "type": "VALVE_CONTROL",
-            "attributes": {"command": "UNPAUSE"},
-        }
-        await self.location.smart_system.call_smart_system_service(valve_id, data)
+        await self._send(valve_id, "UNPAUSE")
+
+    async def pause_many(self, valve_ids) -> None:
+        """Pause several valves concurrently.
+
+        Commands for different valves are independent and the service call is
+        safe to run concurrently on the shared HTTP client.
+        """
+        await asyncio.gather(*(self.pause(valve_id) for valve_id in valve_ids))
@@ -2,6 +2,9 @@ from .base_device import BaseDevice
 
 
 class SoilSensor(BaseDevice):
+    __slots__ = ("soil_humidity", "soil_temperature")
+    _SPECIFIC_TYPES = frozenset({"SENSOR"})
+
     def __init__(self, location, device_map) -> None:
         """Constructor for the sensor device."""
         BaseDevice.__init__(self, location, device_map["COMMON"][0]["id"])
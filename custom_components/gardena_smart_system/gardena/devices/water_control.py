@@ -1,13 +1,25 @@
 """Water control device for Gardena Smart System."""
 
-import uuid
-
 from .base_device import BaseDevice
 
 
 class WaterControl(BaseDevice):
     """Water control device for smart valve management."""
 
+    __slots__ = (
+        "last_error_code",
+        "valve_activity",
+        "valve_duration",
+        "valve_duration_timestamp",
+        "valve_id",
+        "valve_name",
+        "valve_remaining_time",
+        "valve_set_id",
+        "valve_state",
+    )
+    _CONTROL_TYPE = "VALVE_CONTROL"
+    _SPECIFIC_TYPES = frozenset({"VALVE", "VALVE_SET"})
+
     def __init__(self, location, device_map) -> None:
         """Initialize the water control device."""
         BaseDevice.__init__(self, location, device_map["COMMON"][0]["id"])
@@ -42,36 +54,16 @@ class WaterControl(BaseDevice):
 
     async def start_seconds_to_override(self, duration) -> None:
         """Start valve override operation for specified duration in seconds."""
-        data = {
-            "id": str(uuid.uuid1()),
-            "type": "VALVE_CONTROL",
-            "attributes": {"command": "START_SECONDS_TO_OVERRIDE", "seconds": duration},
-        }
-        await self.location.smart_system.call_smart_system_service(self.valve_id, data)
+        await self._send(self.valve_id, "START_SECONDS_TO_OVERRIDE", seconds=duration)
 
     async def stop_until_next_task(self) -> None:
         """Stop valve until next scheduled task."""
-        data = {
-            "id": str(uuid.uuid1()),
-            "type": "VALVE_CONTROL",
-            "attributes": {"command": "STOP_UNTIL_NEXT_TASK"},
-        }
-        await self.location.smart_system.call_smart_system_service(self.valve_id, data)
+        await self._send(self.valve_id, "STOP_UNTIL_NEXT_TASK")
 
     async def pause(self) -> None:
         """Pause the valve operation."""
-        data = {
-            "id": str(uuid.uuid1()),
-            "type": "VALVE_CONTROL",
-            "attributes": {"command": "PAUSE"},
-        }
-        await self.location.smart_system.call_smart_system_service(self.valve_id, data)
+        await self._send(self.valve_id, "PAUSE")
 
     async def unpause(self) -> None:
         """Resume the valve operation."""
-        data = {
-            "id": str(uuid.uuid1()),
-            "type": "VALVE_CONTROL",
-            "attributes": {"command": "UNPAUSE"},
-        }
-        await self.location.smart_system.call_smart_system_service(self.valve_id, data)
+        await self._send(self.valve_id, "UNPAUSE")
@@ -1,3 +1,5 @@
+from collections import defaultdict
+
 from .base_gardena_class import BaseGardenaClass
 
 
@@ -10,6 +12,8 @@ class Location(BaseGardenaClass):
 
     def __init__(self, smart_system, location) -> None:
         self.smart_system = smart_system
+        self.devices = {}
+        self.devices_by_type = defaultdict(list)
         self.update_location_data(location)
 
     def update_location_data(self, location) -> None:
@@ -17,11 +21,11 @@ class Location(BaseGardenaClass):
         self.name = location["attributes"]["name"]
 
     def add_device(self, device) -> None:
+        previous = self.devices.get(device.id)
+        if previous is not None:
+            self.devices_by_type[previous.type].remove(previous)
         self.devices[device.id] = device
+        self.devices_by_type[device.type].append(device)
 
     def find_device_by_type(self, device_type):
-        devices = []
-        for device in self.devices.values():
-            if device.type == device_type:
-                devices.append(device)
-        return devices
+        return list(self.devices_by_type.get(device_type, ()))
@@ -1,8 +1,14 @@
 import asyncio
+import contextlib
 import json
 import logging
+import random
 import ssl
+from collections import defaultdict
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from json.decoder import JSONDecodeError
+from types import MappingProxyType
 
 import backoff
 import httpx
@@ -17,18 +23,105 @@ from .exceptions.authentication_exception import AuthenticationException
 from .location import Location
 from .token_manager import TokenManager
 
+try:
+    import orjson
+except ImportError:  # Home Assistant ships orjson; plain installs may not
+    orjson = None
+
 MAX_BACKOFF_VALUE = 900
+MAX_BACKOFF_TRIES = 8
+MAX_BACKOFF_TIME = 300  # Give up retrying a single request after 5 minutes
 DEFAULT_TIMEOUT = 30.0  # 30 seconds default timeout
 CONNECTION_TIMEOUT = 15.0  # 15 seconds for connection
 READ_TIMEOUT = 30.0  # 30 seconds for reading response
 
-# Create SSL context at module level to avoid blocking event loop
+# Connection pool sized for two API hosts and a handful of concurrent commands
+HTTP_LIMITS = httpx.Limits(
+    max_connections=20,
+    max_keepalive_connections=10,
+    keepalive_expiry=30.0,
+)
+
+# Create SSL contexts once at module level; loading the CA bundle is slow
+# and blocks the event loop. The HTTP client sets the HTTP/2 ALPN list on
+# its context itself, the websocket needs its own context since it only
+# speaks HTTP/1.1.
 _SSL_CONTEXT = ssl.create_default_context()
+_WS_SSL_CONTEXT = ssl.create_default_context()
+_WS_SSL_CONTEXT.set_alpn_protocols(["http/1.1"])
+
+# OS-seeded random source for reconnect jitter
+_RANDOM = random.SystemRandom()
+
+
+def _websocket_ssl_context(context: ssl.SSLContext) -> ssl.SSLContext:
+    """Return an HTTP/1.1-only context trusting the same CAs as the given one."""
+    ca_data = b"".join(context.get_ca_certs(binary_form=True))
+    ws_context = ssl.create_default_context(cadata=ca_data or None)
+    ws_context.check_hostname = context.check_hostname
+    ws_context.verify_mode = context.verify_mode
+    ws_context.set_alpn_protocols(["http/1.1"])
+    return ws_context
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize a request body to UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(data):
+    """Parse a JSON document from str or bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _ws_is_closed(websocket) -> bool:
+    """Return True unless the websocket is known to be open."""
+    try:
+        # 1 = OPEN, 2 = CLOSING, 3 = CLOSED (per websockets.protocol)
+        state = getattr(websocket, "state", None)
+        if state is not None:
+            return state != 1
+        is_open = getattr(websocket, "open", None)
+        if is_open is not None:
+            return not is_open
+        closed = getattr(websocket, "closed", None)
+        if closed is not None:
+            return closed() if callable(closed) else bool(closed)
+        # No close code attribute at all also counts as closed
+        return getattr(websocket, "close_code", 0) is not None
+    except (AttributeError, TypeError):
+        return True  # If any attribute access fails, treat as closed
+
+
+def _parse_retry_after(value) -> float | None:
+    """Return the delay in seconds requested by a Retry-After header."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
 
 
 class RateLimitException(Exception):
     """Exception raised when API rate limit is reached."""
 
+    def __init__(self, message, retry_after: float | None = None) -> None:
+        """Initialize with the delay requested by the server, if any."""
+        super().__init__(message)
+        self.retry_after = retry_after
+
 
 class SmartSystem:
     """Base class to communicate with gardena and handle network calls."""
@@ -49,9 +142,18 @@ class SmartSystem:
         self.logger.setLevel(level)
         self.AUTHENTICATION_HOST = "https://api.authentication.husqvarnagroup.dev"
         self.SMART_HOST = "https://api.smart.gardena.dev"
+        self._revoke_url = f"{self.AUTHENTICATION_HOST}/v1/oauth2/revoke"
         self.client_id = client_id
         self.client_secret = client_secret
+        # Request headers never change, build them once (read-only)
+        self._headers = MappingProxyType(
+            {"Authorization-Provider": "husqvarna", "X-Api-Key": client_id}
+        )
+        self._headers_json = MappingProxyType(
+            {**self._headers, "Content-Type": "application/vnd.api+json"}
+        )
         self.locations = {}
+        self._device_index = {}  # device id -> device, across all locations
         self.level = level
         self.client: AsyncOAuth2Client = None
         self.token_manager = TokenManager(logger=self.logger)
@@ -59,30 +161,32 @@ class SmartSystem:
         self.is_ws_connected = False
         self.ws_status_callback = None
         self.should_stop = False
-        self.supported_services = [
-            "COMMON",
-            "VALVE",
-            "VALVE_SET",
-            "SENSOR",
-            "MOWER",
-            "POWER_SOCKET",
-            "DEVICE",
-        ]
-        # Use provided SSL context or use module-level SSL context
-        self._ssl_context = ssl_context or _SSL_CONTEXT
+        self._stop_event = asyncio.Event()
+        self.supported_services = frozenset(
+            {
+                "COMMON",
+                "VALVE",
+                "VALVE_SET",
+                "SENSOR",
+                "MOWER",
+                "POWER_SOCKET",
+                "DEVICE",
+            }
+        )
+        # Use provided SSL context or the shared module-level ones; a provided
+        # context should itself be created once and reused
+        if ssl_context is None:
+            self._ssl_context = _SSL_CONTEXT
+            self._ws_ssl_context = _WS_SSL_CONTEXT
+        else:
+            # The HTTP client puts h2 into the ALPN list of a shared context
+            self._ssl_context = ssl_context
+            self._ws_ssl_context = _websocket_ssl_context(ssl_context)
 
         # Rate limiting and backoff settings
-        self.connection_attempts = 0
         self.max_backoff = MAX_BACKOFF_VALUE
         self.base_delay = 5
-
-    def create_header(self, include_json=False, with_auth=False):
-        headers = {"Authorization-Provider": "husqvarna", "X-Api-Key": self.client_id}
-        if include_json:
-            headers["Content-Type"] = "application/vnd.api+json"
-        if with_auth and self.token_manager.access_token:
-            headers["Authorization"] = "Bearer " + self.token_manager.access_token
-        return headers
+        self._last_backoff_delay = self.base_delay
 
     async def authenticate(self) -> None:
         """
@@ -108,6 +212,8 @@ class SmartSystem:
             token_endpoint=url,
             verify=self._ssl_context,  # Pass SSL context to httpx client
             timeout=timeout_config,  # Add timeout configuration
+            limits=HTTP_LIMITS,
+            http2=True,  # Multiplex requests to each API host on one connection
         )
 
         try:
@@ -138,12 +244,25 @@ class SmartSystem:
 
     async def quit(self) -> None:
         self.should_stop = True
-        if self.client and self.token_manager.access_token:
-            await self.client.post(
-                f"{self.AUTHENTICATION_HOST}/v1/oauth2/revoke",
-                headers={"Authorization": "Bearer " + self.token_manager.access_token},
-                data={"token": self.token_manager.access_token},
-            )
+        self._stop_event.set()
+        if self.ws is not None and not _ws_is_closed(self.ws):
+            await self.ws.close()
+        client = self.client
+        if client is None:
+            return
+        # Detach the client first so a concurrent quit() does not reuse it
+        self.client = None
+        try:
+            token = self.token_manager.access_token
+            if token:
+                await client.post(
+                    self._revoke_url,
+                    headers={"Authorization": f"Bearer {token}"},
+                    data={"token": token},
+                )
+        finally:
+            # Release pooled connections; authenticate() creates a new client
+            await client.aclose()
 
     async def token_saver(self, token, refresh_token=None, access_token=None) -> None:
         self.token_manager.load_from_oauth2_token(token)
@@ -151,14 +270,12 @@ class SmartSystem:
     async def call_smart_system_service(self, service_id, data) -> None:
         """Call Gardena Smart System service with improved error handling."""
         args = {"data": data}
-        headers = self.create_header(with_auth=True)
-
         try:
             self.logger.debug("Calling service %s with data: %s", service_id, data)
             r = await self.client.put(
                 f"{self.SMART_HOST}/v2/command/{service_id}",
-                headers=headers,
-                data=json.dumps(args, ensure_ascii=False),
+                headers=self._headers_json,
+                content=_json_dumps(args),
             )
             if r.status_code != 202:
                 response = r.json()
@@ -206,15 +323,18 @@ class SmartSystem:
         backoff.expo,
         (HTTPStatusError, ConnectTimeout, ConnectError, TimeoutException),
         max_value=MAX_BACKOFF_VALUE,
+        max_tries=MAX_BACKOFF_TRIES,
+        max_time=MAX_BACKOFF_TIME,
+        jitter=backoff.full_jitter,
         logger=logging.getLogger(__name__),
     )
     async def __call_smart_system_get(self, url):
         try:
             self.logger.debug("Making GET request to: %s", url)
-            response = await self.client.get(url, headers=self.create_header())
+            response = await self.client.get(url, headers=self._headers)
             if self.__response_has_errors(response):
                 return None
-            return json.loads(response.content.decode("utf-8"))
+            return _json_loads(response.content)
         except (ConnectTimeout, ConnectError, TimeoutException) as ex:
             self.logger.exception(
                 "Connection timeout during GET request to %s: %s", url, ex
@@ -241,6 +361,7 @@ class SmartSystem:
                     msg = "No locations found - check if your account has registered devices"
                     raise ConnectionError(msg)
                 self.locations = {}
+                self._device_index = {}
                 for location in response_data["data"]:
                     new_location = Location(self, location)
                     new_location.update_location_data(location)
@@ -260,6 +381,19 @@ class SmartSystem:
             msg = f"Failed to fetch locations: {ex}"
             raise ConnectionError(msg) from ex
 
+    @property
+    def devices(self):
+        """Return the devices of all locations, keyed by device id."""
+        return self._device_index
+
+    def find_device_by_type(self, device_type):
+        """Return the devices of the given type across all locations."""
+        return [
+            device
+            for location in self.locations.values()
+            for device in location.find_device_by_type(device_type)
+        ]
+
     async def update_devices(self, location) -> None:
         response_data = await self.__call_smart_system_get(
             f"{self.SMART_HOST}/v2/locations/{location.id}"
@@ -269,22 +403,24 @@ class SmartSystem:
             if len(response_data["data"]["relationships"]["devices"]["data"]) < 1:
                 self.logger.error("No device found....")
             else:
-                devices_smart_system = {}
-                self.logger.debug("Received devices in  message")
-                self.logger.debug("------- Beginning of message ---------")
-                self.logger.debug(response_data["included"])
+                # device id -> service type -> services
+                devices_smart_system = defaultdict(lambda: defaultdict(list))
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Received devices in  message")
+                    self.logger.debug("------- Beginning of message ---------")
+                    self.logger.debug(response_data["included"])
+                supported = self.supported_services
                 for device in response_data["included"]:
-                    real_id = device["id"].split(":")[0]
-                    if real_id not in devices_smart_system:
-                        devices_smart_system[real_id] = {}
-                    if device["type"] in self.supported_services:
-                        if device["type"] not in devices_smart_system[real_id]:
-                            devices_smart_system[real_id][device["type"]] = []
-                        devices_smart_system[real_id][device["type"]].append(device)
+                    service_type = device["type"]
+                    if service_type not in supported:
+                        continue
+                    real_id = device["id"].partition(":")[0]
+                    devices_smart_system[real_id][service_type].append(device)
                 for parsed_device in devices_smart_system.values():
                     device_obj = DeviceFactory.build(location, parsed_device)
                     if device_obj is not None:
                         location.add_device(device_obj)
+                        self._device_index[device_obj.id] = device_obj
 
     async def start_ws(self, location) -> None:
         """Start WebSocket connection with improved robustness."""
@@ -300,6 +436,7 @@ class SmartSystem:
                 connection_attempts + 1,
             )
             websocket = None
+            retry_after = None
             connection_start_time = asyncio.get_event_loop().time()
 
             try:
@@ -308,8 +445,9 @@ class SmartSystem:
                     ws_url, connection_start_time, max_connection_duration
                 )
 
-                # Reset failure counter on successful connection
+                # Reset failure counter and backoff on successful connection
                 connection_attempts = 0
+                self._last_backoff_delay = self.base_delay
 
             except (ConnectionClosed, InvalidTokenError, OAuthError) as error:
                 connection_attempts += 1
@@ -330,10 +468,10 @@ class SmartSystem:
 
             except RateLimitException as error:
                 connection_attempts += 1
-                delay = self.calculate_backoff_delay()
-                self.logger.warning(
-                    f"Rate limit reached: {error}. Backing off for {delay} seconds."
-                )
+                if error.retry_after is not None:
+                    # Wait as long as the server asks, plus jitter against resync
+                    retry_after = error.retry_after + _RANDOM.uniform(0, 2)
+                self.logger.warning(f"Rate limit reached: {error}. Backing off.")
 
             except Exception as error:
                 # Handle AttributeError for 'closed' gracefully
@@ -353,54 +491,40 @@ class SmartSystem:
                 self.set_ws_status(False)
 
                 # Ensure WebSocket is properly closed
-                if websocket:
-                    # Robustly determine if websocket is closed
-                    closed = True  # Default to closed
-                    try:
-                        if hasattr(websocket, "open"):
-                            closed = not getattr(websocket, "open", True)
-                        elif hasattr(websocket, "closed"):
-                            closed_attr = getattr(websocket, "closed", None)
-                            if callable(closed_attr):
-                                closed = closed_attr()
-                            else:
-                                closed = (
-                                    bool(closed_attr)
-                                    if closed_attr is not None
-                                    else True
-                                )
-                        elif hasattr(websocket, "state"):
-                            # 1 = OPEN, 2 = CLOSING, 3 = CLOSED (per websockets.protocol)
-                            closed = getattr(websocket, "state", 3) != 1
-                        elif hasattr(websocket, "close_code"):
-                            closed = getattr(websocket, "close_code", None) is not None
-                    except (AttributeError, TypeError):
-                        closed = True  # If any attribute access fails, treat as closed
-                    if not closed:
-                        await websocket.close()
-                        self.logger.debug("WebSocket connection closed")
+                if websocket and not _ws_is_closed(websocket):
+                    await websocket.close()
+                    self.logger.debug("WebSocket connection closed")
 
             if not self.should_stop:
-                delay = self.calculate_backoff_delay()
+                delay = (
+                    retry_after
+                    if retry_after is not None
+                    else self.calculate_backoff_delay()
+                )
                 self.logger.debug(f"Sleeping {delay} seconds before reconnect..")
-                # Use shorter sleep intervals to allow faster shutdown
                 await self._wait_with_cancel(delay)
 
-    def calculate_backoff_delay(self):
-        """Calculate exponential backoff delay for reconnection attempts."""
-        return min(self.max_backoff, self.base_delay * (2**self.connection_attempts))
+    def calculate_backoff_delay(self) -> float:
+        """Calculate a decorrelated jitter delay for the next reconnection attempt."""
+        delay = min(
+            self.max_backoff,
+            _RANDOM.uniform(self.base_delay, self._last_backoff_delay * 3),
+        )
+        self._last_backoff_delay = delay
+        return delay
 
     async def _wait_with_cancel(self, delay) -> None:
-        """Wait for specified delay while allowing for cancellation."""
-        for _ in range(int(delay)):
-            if self.should_stop:
-                break
-            await asyncio.sleep(1)
+        """Wait for specified delay, returning early once quit() is called."""
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._stop_event.wait(), timeout=delay)
 
     @backoff.on_exception(
         backoff.expo,
         HTTPStatusError,
         max_value=MAX_BACKOFF_VALUE,
+        max_tries=MAX_BACKOFF_TRIES,
+        max_time=MAX_BACKOFF_TIME,
+        jitter=backoff.full_jitter,
         logger=logging.getLogger(__name__),
     )
     async def __get_ws_url(self, location):
@@ -414,18 +538,20 @@ class SmartSystem:
         self.logger.debug("Trying to get Websocket url")
         r = await self.client.post(
             f"{self.SMART_HOST}/v2/websocket",
-            headers=self.create_header(with_auth=True),
-            data=json.dumps(args, ensure_ascii=False),
+            headers=self._headers_json,
+            content=_json_dumps(args),
         )
         self.logger.debug("Websocket url: got response")
 
         # Check for rate limiting
         if r.status_code == 429:
             msg = "API rate limit reached when retrieving WebSocket URL"
-            raise RateLimitException(msg)
+            raise RateLimitException(
+                msg, _parse_retry_after(r.headers.get("Retry-After"))
+            )
 
         r.raise_for_status()
-        response = r.json()
+        response = _json_loads(r.content)
         ws_url = response["data"]["attributes"]["url"]
         self.logger.debug("Websocket url retrieved successfully")
         return ws_url
@@ -442,7 +568,7 @@ class SmartSystem:
             ping_interval=150,  # Send ping every 150 seconds
             ping_timeout=60,  # Wait 60 seconds for pong
             close_timeout=10,  # Wait 10 seconds for close handshake
-            ssl=self._ssl_context,
+            ssl=self._ws_ssl_context,
             max_size=2**20,  # 1MB max message size
             compression=None,  # Disable compression for better performance
         )
@@ -450,65 +576,31 @@ class SmartSystem:
         self.set_ws_status(True)
         self.logger.debug("WebSocket connected successfully!")
 
+        # quit() closes the websocket to wake up a pending recv()
+        self.ws = websocket
         try:
-            while not self.should_stop:
-                # Check if we've exceeded the 2-hour connection limit
-                current_time = asyncio.get_event_loop().time()
-                if current_time - connection_start_time >= max_connection_duration:
-                    self.logger.info(
-                        "WebSocket connection reached 2-hour limit, reconnecting as per Gardena API requirements"
-                    )
-                    break
-
-                try:
-                    # Use shorter timeout for more responsive shutdown
-                    message = await asyncio.wait_for(websocket.recv(), timeout=5.0)
-                    self.logger.debug("Message received from WebSocket")
-                    self.on_message(message)
-
-                except TimeoutError:
-                    # Check connection health periodically
-                    closed = True  # Default to closed
+            # Pings detect dead peers, so recv() only needs the 2-hour deadline
+            async with asyncio.timeout_at(
+                connection_start_time + max_connection_duration
+            ):
+                # Local bindings for the per-message loop
+                recv = websocket.recv
+                on_message = self.on_message
+                debug = self.logger.debug
+                while not self.should_stop:
                     try:
-                        if hasattr(websocket, "open"):
-                            closed = not getattr(websocket, "open", True)
-                        elif hasattr(websocket, "closed"):
-                            closed_attr = getattr(websocket, "closed", None)
-                            if callable(closed_attr):
-                                closed = closed_attr()
-                            else:
-                                closed = (
-                                    bool(closed_attr)
-                                    if closed_attr is not None
-                                    else True
-                                )
-                        elif hasattr(websocket, "state"):
-                            closed = getattr(websocket, "state", 3) != 1
-                        elif hasattr(websocket, "close_code"):
-                            closed = getattr(websocket, "close_code", None) is not None
-                    except (AttributeError, TypeError) as attr_err:
-                        if isinstance(attr_err, AttributeError) and "closed" in str(
-                            attr_err
-                        ):
-                            self.logger.info(
-                                "WebSocket AttributeError handled in timeout check, treating as closed connection"
-                            )
-                            closed = True
-                        else:
-                            closed = (
-                                True  # If any attribute access fails, treat as closed
-                            )
-                    if closed:
-                        self.logger.info(
-                            "WebSocket connection closed unexpectedly (handled)"
-                        )
+                        message = await recv()
+                    except ConnectionClosed:
+                        if not self.should_stop:
+                            self.logger.warning("WebSocket connection closed by server")
                         break
-                    continue
-
-                except ConnectionClosed:
-                    self.logger.warning("WebSocket connection closed by server")
-                    break
+                    debug("Message received from WebSocket")
+                    on_message(message)
 
+        except TimeoutError:
+            self.logger.info(
+                "WebSocket connection reached 2-hour limit, reconnecting as per Gardena API requirements"
+            )
         except AttributeError as attr_err:
             if "closed" in str(attr_err):
                 self.logger.info(
@@ -525,42 +617,33 @@ class SmartSystem:
             raise
 
         finally:
-            # Robustly determine if websocket is closed
-            closed = True  # Default to closed
+            self.ws = None
+            # Every way out of the loop means the connection should go away;
+            # close() is a no-op on a connection that is already closed
             try:
-                if hasattr(websocket, "open"):
-                    closed = not getattr(websocket, "open", True)
-                elif hasattr(websocket, "closed"):
-                    closed_attr = getattr(websocket, "closed", None)
-                    if callable(closed_attr):
-                        closed = closed_attr()
-                    else:
-                        closed = bool(closed_attr) if closed_attr is not None else True
-                elif hasattr(websocket, "state"):
-                    closed = getattr(websocket, "state", 3) != 1
-                elif hasattr(websocket, "close_code"):
-                    closed = getattr(websocket, "close_code", None) is not None
-            except (AttributeError, TypeError):
-                closed = True  # If any attribute access fails, treat as closed
-            if not closed:
                 await websocket.close()
+            except Exception:
+                self.logger.debug("Error closing websocket", exc_info=True)
 
         return websocket
 
     def on_message(self, message) -> None:
-        data = json.loads(message)
-        self.logger.debug("Received %s message", data["type"])
-        self.logger.debug("------- Beginning of message ---------")
-        self.logger.debug(message)
-        if data["type"] == "LOCATION":
-            self.logger.debug(">>>>>>>>>>>>> Found LOCATION")
+        data = _json_loads(message)
+        message_type = data["type"]
+        debug = self.logger.debug
+        if self.logger.isEnabledFor(logging.DEBUG):
+            debug("Received %s message", message_type)
+            debug("------- Beginning of message ---------")
+            debug(message)
+        if message_type == "LOCATION":
+            debug(">>>>>>>>>>>>> Found LOCATION")
             self.parse_location(data)
-        elif data["type"] in self.supported_services:
-            self.logger.debug(">>>>>>>>>>>>> Found DEVICE")
+        elif message_type in self.supported_services:
+            debug(">>>>>>>>>>>>> Found DEVICE")
             self.parse_device(data)
         else:
-            self.logger.debug(">>>>>>>>>>>>> Unkonwn Message")
-        self.logger.debug("------- End of message ---------")
+            debug(">>>>>>>>>>>>> Unkonwn Message")
+        debug("------- End of message ---------")
 
     def parse_location(self, location) -> None:
         if location["id"] not in self.locations:
@@ -568,11 +651,9 @@ class SmartSystem:
         self.locations[location["id"]].update_location_data(location)
 
     def parse_device(self, device) -> None:
-        device_id = device["id"].split(":")[0]
-        for location in self.locations.values():
-            if device_id in location.devices:
-                location.devices[device_id].update_data(device)
-                break
+        device_obj = self._device_index.get(device["id"].partition(":")[0])
+        if device_obj is not None:
+            device_obj.update_data(device)
 
     def add_ws_status_callback(self, callback) -> None:
         self.ws_status_callback = callback
@@ -1,6 +1,7 @@
 """Support for Gardena Smart System sensors."""
 
 import logging
+from typing import NamedTuple
 
 from homeassistant.components.sensor import SensorDeviceClass, UnitOfTemperature
 from homeassistant.const import (
@@ -8,175 +9,155 @@ from homeassistant.const import (
     PERCENTAGE,
     UnitOfTime,
 )
-from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.device_registry import DeviceInfo
 
 from .const import (
     ATTR_BATTERY_STATE,
     ATTR_RF_LINK_LEVEL,
     ATTR_RF_LINK_STATE,
     DOMAIN,
-    GARDENA_LOCATION,
+    GARDENA_ENTRIES,
 )
+from .entity import GardenaDebouncedEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+
+class SensorSpec(NamedTuple):
+    """Static description of a sensor type."""
+
+    unit: str | None
+    icon: str | None
+    device_class: SensorDeviceClass | None
+
+
 SOIL_SENSOR_TYPES = {
-    "soil_temperature": [
+    "soil_temperature": SensorSpec(
         UnitOfTemperature.CELSIUS,
         "mdi:thermometer",
         SensorDeviceClass.TEMPERATURE,
-    ],
-    "soil_humidity": ["%", "mdi:water-percent", SensorDeviceClass.HUMIDITY],
-    ATTR_BATTERY_LEVEL: [PERCENTAGE, "mdi:battery", SensorDeviceClass.BATTERY],
+    ),
+    "soil_humidity": SensorSpec("%", "mdi:water-percent", SensorDeviceClass.HUMIDITY),
+    ATTR_BATTERY_LEVEL: SensorSpec(
+        PERCENTAGE, "mdi:battery", SensorDeviceClass.BATTERY
+    ),
 }
 
 SENSOR_TYPES = {
-    "ambient_temperature": [
+    "ambient_temperature": SensorSpec(
         UnitOfTemperature.CELSIUS,
         "mdi:thermometer",
         SensorDeviceClass.TEMPERATURE,
-    ],
-    "light_intensity": ["lx", None, SensorDeviceClass.ILLUMINANCE],
+    ),
+    "light_intensity": SensorSpec("lx", None, SensorDeviceClass.ILLUMINANCE),
     **SOIL_SENSOR_TYPES,
 }
 
 # Duration sensor types for different device operations
 DURATION_SENSOR_TYPES = {
-    "override_duration": [UnitOfTime.SECONDS, "mdi:timer", SensorDeviceClass.DURATION],
-    "override_remaining_time": [
+    "override_duration": SensorSpec(
+        UnitOfTime.SECONDS, "mdi:timer", SensorDeviceClass.DURATION
+    ),
+    "override_remaining_time": SensorSpec(
         UnitOfTime.SECONDS,
         "mdi:timer-sand",
         SensorDeviceClass.DURATION,
-    ],
-    "valve_duration": [UnitOfTime.SECONDS, "mdi:timer", SensorDeviceClass.DURATION],
-    "valve_remaining_time": [
+    ),
+    "valve_duration": SensorSpec(
+        UnitOfTime.SECONDS, "mdi:timer", SensorDeviceClass.DURATION
+    ),
+    "valve_remaining_time": SensorSpec(
         UnitOfTime.SECONDS,
         "mdi:timer-sand",
         SensorDeviceClass.DURATION,
-    ],
-    "mowing_duration": [UnitOfTime.SECONDS, "mdi:timer", SensorDeviceClass.DURATION],
-    "mowing_remaining_time": [
+    ),
+    "mowing_duration": SensorSpec(
+        UnitOfTime.SECONDS, "mdi:timer", SensorDeviceClass.DURATION
+    ),
+    "mowing_remaining_time": SensorSpec(
         UnitOfTime.SECONDS,
         "mdi:timer-sand",
         SensorDeviceClass.DURATION,
-    ],
+    ),
 }
 
+# Duration sensors offered per device type when the device reports them
+_MOWER_DURATION_KEYS = ("mowing_duration", "mowing_remaining_time")
+_POWER_SOCKET_DURATION_KEYS = ("override_duration", "override_remaining_time")
+
 
 async def async_setup_entry(hass, config_entry, async_add_entities) -> None:
     """Perform the setup for Gardena sensor devices."""
     entities = []
 
-    # Regular sensors
-    entities.extend(
-        [
-            GardenaSensor(sensor, sensor_type)
-            for sensor in hass.data[DOMAIN][GARDENA_LOCATION].find_device_by_type(
-                "SENSOR"
+    entry_data = hass.data[DOMAIN][GARDENA_ENTRIES][config_entry.entry_id]
+    smart_system = entry_data.smart_system
+    # Walk the devices of all locations once and dispatch on the device type
+    for device in smart_system.devices.values():
+        device_type = device.type
+        if device_type == "SENSOR":
+            # Regular sensors
+            entities.extend(
+                GardenaSensor(device, sensor_type) for sensor_type in SENSOR_TYPES
             )
-            for sensor_type in SENSOR_TYPES
-        ]
-    )
-
-    # Soil sensors
-    entities.extend(
-        [
-            GardenaSensor(sensor, sensor_type)
-            for sensor in hass.data[DOMAIN][GARDENA_LOCATION].find_device_by_type(
-                "SOIL_SENSOR"
+        elif device_type == "SOIL_SENSOR":
+            # Soil sensors
+            entities.extend(
+                GardenaSensor(device, sensor_type) for sensor_type in SOIL_SENSOR_TYPES
             )
-            for sensor_type in SOIL_SENSOR_TYPES
-        ]
-    )
-
-    # Mower sensors (battery + duration)
-    for mower in hass.data[DOMAIN][GARDENA_LOCATION].find_device_by_type("MOWER"):
-        entities.append(GardenaSensor(mower, ATTR_BATTERY_LEVEL))
-        # Add duration sensors for mowing operations
-        entities.extend(
-            [
-                GardenaDurationSensor(mower, duration_type)
-                for duration_type in ["mowing_duration", "mowing_remaining_time"]
-                if hasattr(mower, duration_type)
-                and getattr(mower, duration_type) != "N/A"
-            ]
-        )
-
-    # Water control sensors (battery only)
-    for water_control in hass.data[DOMAIN][GARDENA_LOCATION].find_device_by_type(
-        "WATER_CONTROL"
-    ):
-        entities.append(GardenaSensor(water_control, ATTR_BATTERY_LEVEL))
-
-    # Smart irrigation control sensors - no automatic duration sensors
-    # Duration data is available in valve entity attributes instead
-
-    # Power socket duration sensors
-    for power_socket in hass.data[DOMAIN][GARDENA_LOCATION].find_device_by_type(
-        "POWER_SOCKET"
-    ):
-        entities.extend(
-            [
-                GardenaDurationSensor(power_socket, duration_type)
-                for duration_type in ["override_duration", "override_remaining_time"]
-                if hasattr(power_socket, duration_type)
-                and getattr(power_socket, duration_type) != "N/A"
-            ]
-        )
+        elif device_type == "MOWER":
+            # Mower sensors (battery + duration)
+            entities.append(GardenaSensor(device, ATTR_BATTERY_LEVEL))
+            # Add duration sensors for mowing operations
+            entities.extend(
+                GardenaDurationSensor(device, duration_type)
+                for duration_type in _MOWER_DURATION_KEYS
+                if getattr(device, duration_type, "N/A") != "N/A"
+            )
+        elif device_type == "WATER_CONTROL":
+            # Water control sensors (battery only)
+            entities.append(GardenaSensor(device, ATTR_BATTERY_LEVEL))
+        elif device_type == "POWER_SOCKET":
+            # Power socket duration sensors
+            entities.extend(
+                GardenaDurationSensor(device, duration_type)
+                for duration_type in _POWER_SOCKET_DURATION_KEYS
+                if getattr(device, duration_type, "N/A") != "N/A"
+            )
+        # Smart irrigation control sensors - no automatic duration sensors
+        # Duration data is available in valve entity attributes instead
 
     _LOGGER.debug("Adding sensor as sensor %s", entities)
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities, update_before_add=False)
 
 
-class GardenaDurationSensor(Entity):
+class GardenaDurationSensor(GardenaDebouncedEntity):
     """Representation of a Gardena Duration Sensor for timed operations."""
 
     def __init__(self, device, sensor_type) -> None:
         """Initialize the Gardena Duration Sensor."""
+        spec = DURATION_SENSOR_TYPES[sensor_type]
         self._sensor_type = sensor_type
-        self._name = f"{device.name} {sensor_type.replace('_', ' ')}"
-        self._unique_id = f"{device.serial}-{sensor_type}"
+        self._timestamp_attr = (
+            sensor_type.replace("duration", "duration_timestamp")
+            if "duration" in sensor_type
+            else None
+        )
         self._device = device
-
-    async def async_added_to_hass(self) -> None:
-        """Subscribe to sensor events."""
-        self._device.add_callback(self.update_callback)
-
-    @property
-    def should_poll(self) -> bool:
-        """No polling needed for a sensor."""
-        return False
-
-    def update_callback(self, device) -> None:
-        """Call update for Home Assistant when the device is updated."""
-        self.schedule_update_ha_state(force_refresh=True)
-
-    @property
-    def name(self):
-        """Return the name of the device."""
-        return self._name
-
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        return self._unique_id
-
-    @property
-    def icon(self):
-        """Return the icon to use in the frontend."""
-        return DURATION_SENSOR_TYPES[self._sensor_type][1]
-
-    @property
-    def unit_of_measurement(self):
-        """Return the unit of measurement of this entity, if any."""
-        return DURATION_SENSOR_TYPES[self._sensor_type][0]
-
-    @property
-    def device_class(self):
-        """Return the device class of this entity."""
-        if self._sensor_type in DURATION_SENSOR_TYPES:
-            return DURATION_SENSOR_TYPES[self._sensor_type][2]
-        return None
+        self._attr_name = f"{device.name} {sensor_type.replace('_', ' ')}"
+        self._attr_unique_id = f"{device.serial}-{sensor_type}"
+        self._attr_icon = spec.icon
+        self._attr_unit_of_measurement = spec.unit
+        self._attr_device_class = spec.device_class
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, device.serial)},
+            name=device.name,
+            manufacturer="Gardena",
+            model=device.model_type,
+        )
+        self._attrs = {}
+        self._attrs_key: tuple | None = None
+        self._refresh_attributes()
 
     @property
     def state(self):
@@ -188,86 +169,64 @@ class GardenaDurationSensor(Entity):
     @property
     def extra_state_attributes(self):
         """Return the state attributes of the sensor."""
+        return self._attrs
+
+    def _refresh_attributes(self) -> None:
+        """Rebuild the cached state attributes from the device."""
+        device = self._device
+        timestamp = (
+            getattr(device, self._timestamp_attr, "N/A")
+            if self._timestamp_attr
+            else "N/A"
+        )
+        # Keep the previous dict while none of its inputs changed
+        key = (
+            device.battery_level,
+            device.battery_state,
+            device.rf_link_level,
+            device.rf_link_state,
+            timestamp,
+        )
+        if key == self._attrs_key:
+            return
+
         attributes = {
-            ATTR_BATTERY_LEVEL: self._device.battery_level,
-            ATTR_BATTERY_STATE: self._device.battery_state,
-            ATTR_RF_LINK_LEVEL: self._device.rf_link_level,
-            ATTR_RF_LINK_STATE: self._device.rf_link_state,
+            ATTR_BATTERY_LEVEL: device.battery_level,
+            ATTR_BATTERY_STATE: device.battery_state,
+            ATTR_RF_LINK_LEVEL: device.rf_link_level,
+            ATTR_RF_LINK_STATE: device.rf_link_state,
         }
 
         # Add duration-specific timestamp if available
-        if "duration" in self._sensor_type:
-            timestamp_attr = self._sensor_type.replace("duration", "duration_timestamp")
-            if hasattr(self._device, timestamp_attr):
-                timestamp_value = getattr(self._device, timestamp_attr)
-                if timestamp_value != "N/A":
-                    attributes["timestamp"] = timestamp_value
+        if timestamp != "N/A":
+            attributes["timestamp"] = timestamp
 
-        return attributes
-
-    @property
-    def device_info(self):
-        """Return device information."""
-        return {
-            "identifiers": {
-                # Serial numbers are unique identifiers within a specific domain
-                (DOMAIN, self._device.serial)
-            },
-            "name": self._device.name,
-            "manufacturer": "Gardena",
-            "model": self._device.model_type,
-        }
+        self._attrs_key = key
+        self._attrs = attributes
 
 
-class GardenaSensor(Entity):
+class GardenaSensor(GardenaDebouncedEntity):
     """Representation of a Gardena Sensor."""
 
     def __init__(self, device, sensor_type) -> None:
         """Initialize the Gardena Sensor."""
+        spec = SENSOR_TYPES[sensor_type]
         self._sensor_type = sensor_type
-        self._name = f"{device.name} {sensor_type.replace('_', ' ')}"
-        self._unique_id = f"{device.serial}-{sensor_type}"
         self._device = device
-
-    async def async_added_to_hass(self) -> None:
-        """Subscribe to sensor events."""
-        self._device.add_callback(self.update_callback)
-
-    @property
-    def should_poll(self) -> bool:
-        """No polling needed for a sensor."""
-        return False
-
-    def update_callback(self, device) -> None:
-        """Call update for Home Assistant when the device is updated."""
-        self.schedule_update_ha_state(force_refresh=True)
-
-    @property
-    def name(self):
-        """Return the name of the device."""
-        return self._name
-
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        return self._unique_id
-
-    @property
-    def icon(self):
-        """Return the icon to use in the frontend."""
-        return SENSOR_TYPES[self._sensor_type][1]
-
-    @property
-    def unit_of_measurement(self):
-        """Return the unit of measurement of this entity, if any."""
-        return SENSOR_TYPES[self._sensor_type][0]
-
-    @property
-    def device_class(self):
-        """Return the device class of this entity."""
-        if self._sensor_type in SENSOR_TYPES:
-            return SENSOR_TYPES[self._sensor_type][2]
-        return None
+        self._attr_name = f"{device.name} {sensor_type.replace('_', ' ')}"
+        self._attr_unique_id = f"{device.serial}-{sensor_type}"
+        self._attr_icon = spec.icon
+        self._attr_unit_of_measurement = spec.unit
+        self._attr_device_class = spec.device_class
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, device.serial)},
+            name=device.name,
+            manufacturer="Gardena",
+            model=device.model_type,
+        )
+        self._attrs = {}
+        self._attrs_key: tuple | None = None
+        self._refresh_attributes()
 
     @property
     def state(self):
@@ -277,22 +236,25 @@ class GardenaSensor(Entity):
     @property
     def extra_state_attributes(self):
         """Return the state attributes of the sensor."""
-        return {
-            ATTR_BATTERY_LEVEL: self._device.battery_level,
-            ATTR_BATTERY_STATE: self._device.battery_state,
-            ATTR_RF_LINK_LEVEL: self._device.rf_link_level,
-            ATTR_RF_LINK_STATE: self._device.rf_link_state,
-        }
-
-    @property
-    def device_info(self):
-        """Return device information."""
-        return {
-            "identifiers": {
-                # Serial numbers are unique identifiers within a specific domain
-                (DOMAIN, self._device.serial)
-            },
-            "name": self._device.name,
-            "manufacturer": "Gardena",
-            "model": self._device.model_type,
+        return self._attrs
+
+    def _refresh_attributes(self) -> None:
+        """Rebuild the cached state attributes from the device."""
+        device = self._device
+        # Keep the previous dict while none of its inputs changed
+        key = (
+            device.battery_level,
+            device.battery_state,
+            device.rf_link_level,
+            device.rf_link_state,
+        )
+        if key == self._attrs_key:
+            return
+
+        self._attrs_key = key
+        self._attrs = {
+            ATTR_BATTERY_LEVEL: device.battery_level,
+            ATTR_BATTERY_STATE: device.battery_state,
+            ATTR_RF_LINK_LEVEL: device.rf_link_level,
+            ATTR_RF_LINK_STATE: device.rf_link_state,
         }
@@ -5,103 +5,130 @@ from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
     DEFAULT_SMART_WATERING_DURATION,
     DOMAIN,
-    GARDENA_LOCATION,
+    GARDENA_ENTRIES,
+    UPDATE_DEBOUNCE_COOLDOWN,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# (state attribute, device field) pairs exposed when the device type declares them
+_BASE_ATTRIBUTES = (
+    ("battery_level", "battery_level"),
+    ("battery_state", "battery_state"),
+    ("activity", "activity"),
+    ("device_state", "state"),
+)
+_VALVE_ATTRIBUTES = (
+    ("valve_activity", "valve_activity"),
+    ("valve_state", "valve_state"),
+)
+
+# Service states that report an error code instead of an activity
+_ERROR_STATES = frozenset({"WARNING", "ERROR", "UNAVAILABLE"})
+# Power socket activities that mean the socket is switched on
+_ON_ACTIVITIES = frozenset({"FOREVER_ON", "TIME_LIMITED_ON", "SCHEDULED_ON"})
+# Valve activities that mean the water control is watering
+_WATERING_ACTIVITIES = frozenset({"MANUAL_WATERING", "SCHEDULED_WATERING"})
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up Gardena Smart System switches."""
-    entities = []
-
-    # Power socket switches
-    entities.extend(
-        GardenaPowerSocketSwitch(power_socket)
-        for power_socket in hass.data[DOMAIN][GARDENA_LOCATION].find_device_by_type(
-            "POWER_SOCKET"
-        )
-    )
-
-    # Water control switches
-    entities.extend(
-        GardenaWaterControlSwitch(water_control)
-        for water_control in hass.data[DOMAIN][GARDENA_LOCATION].find_device_by_type(
-            "WATER_CONTROL"
-        )
-    )
+    switch_classes = {
+        "POWER_SOCKET": GardenaPowerSocketSwitch,
+        "WATER_CONTROL": GardenaWaterControlSwitch,
+    }
+    entry_data = hass.data[DOMAIN][GARDENA_ENTRIES][entry.entry_id]
+    smart_system = entry_data.smart_system
+    # Walk the devices of all locations once and dispatch on the device type
+    entities = [
+        switch_class(device)
+        for device in smart_system.devices.values()
+        if (switch_class := switch_classes.get(device.type)) is not None
+    ]
 
     _LOGGER.debug("Adding %d switch entities", len(entities))
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities, update_before_add=False)
 
 
 class GardenaBaseSwitch(SwitchEntity):
     """Base class for Gardena switches."""
 
+    _attr_should_poll = False
+    _ATTRIBUTE_CANDIDATES = _BASE_ATTRIBUTES
+    # Device attribute holding the service state of the switched service
+    _STATE_FIELD = "state"
+
     def __init__(self, device: Any) -> None:
         """Initialize the Gardena switch."""
         self._device = device
-        self._name = self._device.name
-        self._device.add_update_callback(self.update_callback)
-        self._attr_unique_id = f"{self._device.id}_{self._device.type}"
+        # Resolve once which of the candidate fields this device type declares
+        self._state_keys = tuple(
+            (key, name)
+            for key, name in self._ATTRIBUTE_CANDIDATES
+            if type(device).declares(name)
+        )
+        self._attr_name = device.name
+        self._attr_unique_id = f"{device.id}_{device.type}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, device.serial)},
+            name=device.name,
+            manufacturer="Gardena",
+            model=device.model_type,
+        )
+        self._debouncer = None
+        self._last_signature = None
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to device updates."""
+        self._debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=UPDATE_DEBOUNCE_COOLDOWN,
+            immediate=True,
+            function=self.async_write_ha_state,
+        )
+        self._last_signature = self._signature()
+        self._device.add_callback(self.update_callback)
 
-    @property
-    def should_poll(self) -> bool:
-        """Return true if the device should be polled for updates."""
-        return False
+    async def async_will_remove_from_hass(self) -> None:
+        """Unsubscribe from device updates."""
+        self._device.remove_callback(self.update_callback)
+        self._debouncer.async_shutdown()
 
+    @callback
     def update_callback(self, device: Any) -> None:
-        """Call update for Home Assistant when the device is updated."""
-        self.schedule_update_ha_state(force_refresh=True)
-
-    @property
-    def name(self) -> str:
-        """Return the name of the switch."""
-        return self._name
+        """Coalesce device updates into state writes."""
+        signature = self._signature()
+        if signature == self._last_signature:
+            # Nothing Home Assistant shows for this switch changed
+            return
+        self._last_signature = signature
+        self._debouncer.async_schedule_call()
+
+    def _signature(self) -> tuple:
+        """Return the externally visible state of the switch."""
+        return (self.is_on, self.available, self.extra_state_attributes)
 
     @property
     def available(self) -> bool:
         """Return True if the device is available."""
-        return self._device.state != "UNAVAILABLE"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device.id)},
-            name=self._device.name,
-            manufacturer="Gardena",
-            model=self._device.type,
-        )
+        return getattr(self._device, self._STATE_FIELD) != "UNAVAILABLE"
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes of the switch."""
-        attributes = {}
-
-        if hasattr(self._device, "battery_level"):
-            attributes["battery_level"] = self._device.battery_level
-        if hasattr(self._device, "battery_state"):
-            attributes["battery_state"] = self._device.battery_state
-        if hasattr(self._device, "radio_quality"):
-            attributes["radio_quality"] = self._device.radio_quality
-        if hasattr(self._device, "radio_state"):
-            attributes["radio_state"] = self._device.radio_state
-        if hasattr(self._device, "activity"):
-            attributes["activity"] = self._device.activity
-        if hasattr(self._device, "state"):
-            attributes["device_state"] = self._device.state
-
-        return attributes
+        device = self._device
+        return {key: getattr(device, name) for key, name in self._state_keys}
 
 
 class GardenaPowerSocketSwitch(GardenaBaseSwitch):
@@ -112,52 +139,50 @@ class GardenaPowerSocketSwitch(GardenaBaseSwitch):
         super().__init__(device)
 
     @property
-    def is_on(self) -> bool:
+    def is_on(self) -> bool | None:
         """Return true if the power socket is on."""
-        return getattr(self._device, "activity", "OFF") == "ON"
+        device = self._device
+        if device.state in _ERROR_STATES:
+            return None
+        return device.activity in _ON_ACTIVITIES
+
+    @property
+    def error(self) -> str:
+        """Return the error code while the power socket is in an error state."""
+        device = self._device
+        return device.last_error_code if device.state in _ERROR_STATES else ""
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the power socket on."""
-        duration = kwargs.get("duration", DEFAULT_SMART_WATERING_DURATION)
-        await self._device.start_override(duration)
+        await self._device.start_override()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the power socket off."""
-        await self._device.stop_override()
+        await self._device.stop_until_next_task()
 
 
 class GardenaWaterControlSwitch(GardenaBaseSwitch):
     """Representation of a Gardena Water Control switch."""
 
+    _ATTRIBUTE_CANDIDATES = _BASE_ATTRIBUTES + _VALVE_ATTRIBUTES
+    _STATE_FIELD = "valve_state"
+
     def __init__(self, device: Any) -> None:
         """Initialize the Gardena water control switch."""
         super().__init__(device)
 
     @property
-    def is_on(self) -> bool:
+    def is_on(self) -> bool | None:
         """Return true if the water control is watering."""
-        return getattr(self._device, "valve_activity", "CLOSED") in [
-            "MANUAL_WATERING",
-            "SCHEDULED_WATERING",
-        ]
+        if self._device.valve_state == "UNAVAILABLE":
+            return None
+        return getattr(self._device, "valve_activity", "CLOSED") in _WATERING_ACTIVITIES
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Start watering."""
         duration = kwargs.get("duration", DEFAULT_SMART_WATERING_DURATION)
-        await self._device.start_watering(duration)
+        await self._device.start_seconds_to_override(duration * 60)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Stop watering."""
-        await self._device.stop_watering()
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes of the water control switch."""
-        attributes = super().extra_state_attributes
-
-        if hasattr(self._device, "valve_activity"):
-            attributes["valve_activity"] = self._device.valve_activity
-        if hasattr(self._device, "valve_state"):
-            attributes["valve_state"] = self._device.valve_state
-
-        return attributes
+        await self._device.stop_until_next_task()
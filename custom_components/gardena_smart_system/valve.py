@@ -1,7 +1,10 @@
 """Support for Gardena valves (Water control, smart irrigation control)."""
 
+from __future__ import annotations
+
 import datetime
 import logging
+import time
 
 from homeassistant.components.valve import (
     ValveDeviceClass,
@@ -10,7 +13,8 @@ from homeassistant.components.valve import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_BATTERY_LEVEL
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_time_interval
 
@@ -25,7 +29,7 @@ from .const import (
     DEFAULT_SMART_IRRIGATION_DURATION,
     DEFAULT_SMART_WATERING_DURATION,
     DOMAIN,
-    GARDENA_LOCATION,
+    GARDENA_ENTRIES,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -33,6 +37,14 @@ _LOGGER = logging.getLogger(__name__)
 # Constants for pending state change protection
 PENDING_STATE_TIMEOUT_SECONDS = 10
 
+# Valve activities that mean the valve is watering
+_ACTIVE_ACTIVITIES = frozenset({"MANUAL_WATERING", "SCHEDULED_WATERING"})
+# Valve states that report an error code instead of an activity
+_ERROR_STATES = frozenset({"WARNING", "ERROR", "UNAVAILABLE"})
+
+# How often the remaining watering time of irrigation valves is refreshed
+REMAINING_TIME_UPDATE_INTERVAL = datetime.timedelta(seconds=10)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -40,139 +52,229 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the valves platform."""
-    entities = []
-    for water_control in hass.data[DOMAIN][GARDENA_LOCATION].find_device_by_type(
-        "WATER_CONTROL"
-    ):
-        entities.append(GardenaSmartWaterControl(water_control, config_entry.options))
-
-    for smart_irrigation in hass.data[DOMAIN][GARDENA_LOCATION].find_device_by_type(
-        "SMART_IRRIGATION_CONTROL"
-    ):
-        for valve in smart_irrigation.valves.values():
-            entities.append(
-                GardenaSmartIrrigationControl(
-                    smart_irrigation, valve["id"], config_entry.options
-                )
+    remaining_time_timer = _RemainingTimeTimer(hass)
+    config_entry.async_on_unload(remaining_time_timer.async_stop)
+    entry_data = hass.data[DOMAIN][GARDENA_ENTRIES][config_entry.entry_id]
+    smart_system = entry_data.smart_system
+    entities = [
+        GardenaSmartWaterControl(water_control, config_entry.options)
+        for water_control in smart_system.find_device_by_type("WATER_CONTROL")
+    ]
+    entities.extend(
+        [
+            GardenaSmartIrrigationControl(
+                smart_irrigation,
+                valve["id"],
+                config_entry.options,
+                remaining_time_timer,
             )
+            for smart_irrigation in smart_system.find_device_by_type(
+                "SMART_IRRIGATION_CONTROL"
+            )
+            for valve in smart_irrigation.valves.values()
+        ]
+    )
 
     _LOGGER.debug(
         "Adding water control and smart irrigation control as valve: %s", entities
     )
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities, update_before_add=False)
 
 
-class GardenaSmartWaterControl(ValveEntity):
-    """Representation of a Gardena Smart Water Control."""
+class _RemainingTimeTimer:
+    """Shared interval refreshing the remaining time of watering valves.
 
-    def __init__(self, wc, options) -> None:
-        """Initialize the Gardena Smart Water Control."""
-        self._device = wc
+    The interval only runs while at least one valve is watering.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the timer without scheduling it."""
+        self._hass = hass
+        self._valves: set[GardenaSmartIrrigationControl] = set()
+        self._unsub = None
+
+    @callback
+    def async_add(self, valve: GardenaSmartIrrigationControl) -> None:
+        """Refresh the valve on every tick, starting the interval if needed."""
+        self._valves.add(valve)
+        if self._unsub is None:
+            self._unsub = async_track_time_interval(
+                self._hass, self._async_tick, REMAINING_TIME_UPDATE_INTERVAL
+            )
+
+    @callback
+    def async_discard(self, valve: GardenaSmartIrrigationControl) -> None:
+        """Stop refreshing the valve, cancelling the interval once idle."""
+        self._valves.discard(valve)
+        if not self._valves:
+            self.async_stop()
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the interval."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _async_tick(self, now) -> None:
+        """Refresh the remaining time of all watering valves."""
+        for valve in tuple(self._valves):
+            valve.async_update_remaining_time()
+
+
+class _GardenaValveBase(ValveEntity):
+    """Common behaviour of the Gardena valve entities.
+
+    Subclasses look up the valve fields in ``_valve_state``,
+    ``_valve_activity`` and ``_valve_error_code``.
+    """
+
+    _attr_device_class = ValveDeviceClass.WATER
+    _attr_reports_position = False
+    _attr_should_poll = False
+    _attr_supported_features = ValveEntityFeature.OPEN | ValveEntityFeature.CLOSE
+
+    # Start of a pending user action that overrides the device state
+    _pending_state_timestamp: float | None = None
+
+    def __init__(self, device, options) -> None:
+        """Initialize the state shared by all Gardena valves."""
+        self._device = device
         self._options = options
-        self._name = f"{self._device.name}"
-        self._unique_id = f"{self._device.serial}-valve"
+        # Resolve once which duration attributes the device exposes
+        self._has_duration = hasattr(device, "valve_duration")
+        self._has_duration_ts = hasattr(device, "valve_duration_timestamp")
+        self._has_remaining = hasattr(device, "valve_remaining_time")
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, device.serial)},
+            name=device.name,
+            manufacturer="Gardena",
+            model=device.model_type,
+        )
         self._state = None
         self._error_message = ""
-        # Track pending state changes to prevent override
-        self._pending_state_change = None
-        self._pending_state_timestamp = None
+        self._last_signature = None
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to events."""
         self._device.add_callback(self.update_callback)
 
-    @property
-    def should_poll(self) -> bool:
-        """No polling needed for a water valve."""
-        return False
+    async def async_will_remove_from_hass(self) -> None:
+        """Unsubscribe from events."""
+        self._device.remove_callback(self.update_callback)
 
+    @callback
     def update_callback(self, device) -> None:
-        """Call update for Home Assistant when the device is updated."""
-        self.schedule_update_ha_state(force_refresh=True)
+        """Recompute the state and write it if anything visible changed."""
+        self._update_state()
+        signature = (self._state, self.available, self.extra_state_attributes)
+        if signature == self._last_signature:
+            return
+        self._last_signature = signature
+        self.async_write_ha_state()
 
-    async def async_update(self) -> None:
-        """Update the states of Gardena devices."""
-        _LOGGER.debug("Running Gardena update")
+    def _valve_state(self) -> str:
+        """Return the service state of the valve."""
+        raise NotImplementedError
 
-        # Check if we have a pending state change that should be respected
-        if (
-            self._pending_state_change is not None
-            and self._pending_state_timestamp is not None
-        ):
-            # Only respect pending state for defined timeout period
-            time_diff = (
-                datetime.datetime.now(tz=datetime.UTC) - self._pending_state_timestamp
-            )
-            if time_diff.total_seconds() < PENDING_STATE_TIMEOUT_SECONDS:
-                _LOGGER.debug("Skipping state update due to pending user action")
-                return
-            # Clear expired pending state
-            self._pending_state_change = None
-            self._pending_state_timestamp = None
+    def _valve_activity(self) -> str:
+        """Return the activity of the valve."""
+        raise NotImplementedError
+
+    def _valve_error_code(self) -> str:
+        """Return the last error code of the valve."""
+        raise NotImplementedError
+
+    def _update_state(self) -> None:
+        """Derive the valve state from the device data."""
+        # Respect a pending user action over the device state
+        if self._pending_state_active():
+            return
 
         # Managing state
-        state = self._device.valve_state
-        _LOGGER.debug("Water control has state %s", state)
-        if state in ["WARNING", "ERROR", "UNAVAILABLE"]:
-            _LOGGER.debug("Water control has an error")
+        state = self._valve_state()
+        _LOGGER.debug("%s has state %s", self._attr_name, state)
+        if state in _ERROR_STATES:
+            _LOGGER.debug("%s has an error", self._attr_name)
             self._state = False
-            self._error_message = self._device.last_error_code
+            self._error_message = self._valve_error_code()
         else:
-            _LOGGER.debug("Getting water control state")
-            activity = self._device.valve_activity
+            activity = self._valve_activity()
             self._error_message = ""
-            _LOGGER.debug("Water control has activity %s", activity)
+            _LOGGER.debug("%s has activity %s", self._attr_name, activity)
             if activity == "CLOSED":
                 self._state = False
-            elif activity in ["MANUAL_WATERING", "SCHEDULED_WATERING"]:
+            elif activity in _ACTIVE_ACTIVITIES:
                 self._state = True
             else:
-                _LOGGER.debug("Water control has none activity")
-
-    @property
-    def name(self):
-        """Return the name of the device."""
-        return self._name
+                _LOGGER.debug("%s has unknown activity", self._attr_name)
+
+    def _pending_state_active(self) -> bool:
+        """Return True while a recent user action overrides the device state."""
+        if self._pending_state_timestamp is None:
+            return False
+        # Only respect pending state for defined timeout period
+        pending_age = time.monotonic() - self._pending_state_timestamp
+        if pending_age < PENDING_STATE_TIMEOUT_SECONDS:
+            _LOGGER.debug("Skipping state update due to pending user action")
+            return True
+        # Clear expired pending state
+        self._pending_state_timestamp = None
+        return False
 
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        return self._unique_id
+    def _set_pending(self, state: bool) -> None:
+        """Show the requested state and hold it against device updates."""
+        self._pending_state_timestamp = time.monotonic()
+        self._state = state
+        # The optimistic state bypasses update_callback, so the next device
+        # push must be written even if it matches the last one seen
+        self._last_signature = None
 
     @property
     def is_closed(self) -> bool:
         """Return true if the valve is closed."""
         return not self._state
 
-    @property
-    def device_class(self):
-        """Return the device class for water valves."""
-        return ValveDeviceClass.WATER
-
-    @property
-    def supported_features(self):
-        """Return the supported features."""
-        return ValveEntityFeature.OPEN | ValveEntityFeature.CLOSE
-
-    @property
-    def reports_position(self) -> bool:
-        """Return False as this valve does not report position."""
-        return False
-
     @property
     def available(self):
         """Return True if the device is available."""
-        return self._device.valve_state != "UNAVAILABLE"
+        return self._valve_state() != "UNAVAILABLE"
 
     def error(self):
         """Return the error message."""
         return self._error_message
 
+
+class GardenaSmartWaterControl(_GardenaValveBase):
+    """Representation of a Gardena Smart Water Control."""
+
+    def __init__(self, wc, options) -> None:
+        """Initialize the Gardena Smart Water Control."""
+        super().__init__(wc, options)
+        self._attr_name = wc.name
+        self._attr_unique_id = f"{wc.serial}-valve"
+        # Seed the state from the data the library already holds
+        self._update_state()
+
+    def _valve_state(self) -> str:
+        """Return the service state of the valve."""
+        return self._device.valve_state
+
+    def _valve_activity(self) -> str:
+        """Return the activity of the valve."""
+        return self._device.valve_activity
+
+    def _valve_error_code(self) -> str:
+        """Return the last error code of the valve."""
+        return self._device.last_error_code
+
     @property
     def extra_state_attributes(self):
         """Return the state attributes of the water valve."""
+        valve_activity = self._device.valve_activity
         attributes = {
-            ATTR_ACTIVITY: self._device.valve_activity,
+            ATTR_ACTIVITY: valve_activity,
             ATTR_BATTERY_LEVEL: self._device.battery_level,
             ATTR_BATTERY_STATE: self._device.battery_state,
             ATTR_RF_LINK_LEVEL: self._device.rf_link_level,
@@ -181,20 +283,19 @@ class GardenaSmartWaterControl(ValveEntity):
         }
 
         # Add duration attributes if available as numbers (seconds) - only if valve is active
-        valve_activity = getattr(self._device, "valve_activity", "CLOSED")
-        is_valve_active = valve_activity in ["MANUAL_WATERING", "SCHEDULED_WATERING"]
+        is_valve_active = valve_activity in _ACTIVE_ACTIVITIES
 
         # Only show duration attributes if valve is active AND has valid values
         if (
             is_valve_active
-            and hasattr(self._device, "valve_duration")
+            and self._has_duration
             and isinstance(self._device.valve_duration, int)
             and self._device.valve_duration > 0
         ):
             attributes["valve_duration"] = self._device.valve_duration
         if (
             is_valve_active
-            and hasattr(self._device, "valve_duration_timestamp")
+            and self._has_duration_ts
             and self._device.valve_duration_timestamp != "N/A"
         ):
             attributes["valve_duration_timestamp"] = (
@@ -202,7 +303,7 @@ class GardenaSmartWaterControl(ValveEntity):
             )
         if (
             is_valve_active
-            and hasattr(self._device, "valve_remaining_time")
+            and self._has_remaining
             and isinstance(self._device.valve_remaining_time, int)
             and self._device.valve_remaining_time > 0
         ):
@@ -220,389 +321,207 @@ class GardenaSmartWaterControl(ValveEntity):
         """Open the valve to start watering."""
         duration = self.option_smart_watering_duration * 60
         await self._device.start_seconds_to_override(duration)
-        # Set pending state to prevent immediate override
-        self._pending_state_change = True
-        self._pending_state_timestamp = datetime.datetime.now(tz=datetime.UTC)
-        # Immediately update state for responsive UI
-        self._state = True
+        # Immediately update state for responsive UI, holding off device updates
+        self._set_pending(True)
         self.async_write_ha_state()
 
     async def async_close_valve(self) -> None:
         """Close the valve to stop watering."""
         await self._device.stop_until_next_task()
-        # Set pending state to prevent immediate override
-        self._pending_state_change = False
-        self._pending_state_timestamp = datetime.datetime.now(tz=datetime.UTC)
-        # Immediately update state for responsive UI
-        self._state = False
+        # Immediately update state for responsive UI, holding off device updates
+        self._set_pending(False)
         self.async_write_ha_state()
 
-    @property
-    def device_info(self):
-        return {
-            "identifiers": {
-                # Serial numbers are unique identifiers within a specific domain
-                (DOMAIN, self._device.serial)
-            },
-            "name": self._device.name,
-            "manufacturer": "Gardena",
-            "model": self._device.model_type,
-        }
-
 
-class GardenaSmartIrrigationControl(ValveEntity):
+class GardenaSmartIrrigationControl(_GardenaValveBase):
     """Representation of a Gardena Smart Irrigation Control."""
 
-    def __init__(self, sic, valve_id, options) -> None:
+    def __init__(self, sic, valve_id, options, remaining_time_timer) -> None:
         """Initialize the Gardena Smart Irrigation Control."""
-        self._device = sic
+        super().__init__(sic, options)
         self._valve_id = valve_id
-        self._options = options
-        self._name = (
-            f"{self._device.name} - {self._device.valves[self._valve_id]['name']}"
-        )
-        self._unique_id = f"{self._device.serial}-valve-{self._valve_id}"
-        self._state = None
-        self._error_message = ""
-        # Track pending state changes to prevent override
-        self._pending_state_change = None
-        self._pending_state_timestamp = None
-
-        # Timer for regular remaining time updates
-        self._update_timer = None
+        self._remaining_time_timer = remaining_time_timer
+        self._has_durations_map = hasattr(sic, "valve_durations")
+        self._attr_name = f"{sic.name} - {sic.valves[valve_id]['name']}"
+        self._attr_unique_id = f"{sic.serial}-valve-{valve_id}"
+        self._attrs_key: tuple | None = None
+        self._attrs_cache: dict | None = None
+        # Start of the current run, parsed once per timestamp
+        self._cached_start_ts: str | None = None
+        self._cached_start_epoch: float | None = None
+        # Seed the state from the data the library already holds
+        self._update_state()
 
     async def async_added_to_hass(self) -> None:
-        """Subscribe to events."""
-        self._device.add_callback(self.update_callback)
-
-        # Set up timer for regular remaining time updates
-        self._update_timer = async_track_time_interval(
-            self.hass, self._async_timer_update, datetime.timedelta(seconds=10)
-        )
-        _LOGGER.debug("Timer set up for irrigation valve %s", self._valve_id)
+        """Subscribe to events and start the remaining time updates."""
+        await super().async_added_to_hass()
+        self._sync_timer()
 
     async def async_will_remove_from_hass(self) -> None:
-        """Clean up timer when removing from hass."""
-        if self._update_timer:
-            self._update_timer()
-            self._update_timer = None
-
-    async def _async_timer_update(self, now) -> None:
+        """Unsubscribe from events and stop the remaining time updates."""
+        self._remaining_time_timer.async_discard(self)
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _sync_timer(self) -> None:
+        """Take part in the remaining time updates only while watering."""
+        if self._state:
+            self._remaining_time_timer.async_add(self)
+        else:
+            self._remaining_time_timer.async_discard(self)
+
+    def _compute_remaining(self, valve_duration_data) -> int:
+        """Return the remaining seconds of the valve run described by the data."""
+        timestamp = valve_duration_data["timestamp"]
+        if timestamp != self._cached_start_ts:
+            self._cached_start_epoch = datetime.datetime.fromisoformat(
+                timestamp
+            ).timestamp()
+            self._cached_start_ts = timestamp
+        elapsed_seconds = int(time.time() - self._cached_start_epoch)
+        return max(0, valve_duration_data["duration"] - elapsed_seconds)
+
+    def _recalc_remaining(self, valve_duration_data) -> int | None:
+        """Refresh the remaining time of an active valve run.
+
+        Returns None if the data describes no active run with a duration.
+        """
+        was_active = valve_duration_data.get("was_active")
+        timestamp = valve_duration_data.get("timestamp")
+        duration = valve_duration_data.get("duration")
+        if not (
+            was_active
+            and timestamp != "N/A"
+            and isinstance(duration, int)
+            and duration > 0
+        ):
+            return None
+        try:
+            remaining_seconds = self._compute_remaining(valve_duration_data)
+        except (TypeError, ValueError) as e:
+            _LOGGER.debug("Error in remaining time calculation: %s", e)
+            return None
+        valve_duration_data["remaining_time"] = remaining_seconds
+        return remaining_seconds
+
+    @callback
+    def async_update_remaining_time(self) -> None:
         """Timer-based update for remaining time."""
+        if not self._state:
+            # Nothing counts down while the valve is not watering
+            return
         # Only update if valve has active duration tracking
+        valve_duration_data = (
+            self._device.valve_durations.get(self._valve_id)
+            if self._has_durations_map
+            else None
+        )
         if (
-            hasattr(self._device, "valve_durations")
-            and self._valve_id in self._device.valve_durations
+            valve_duration_data is not None
+            and self._recalc_remaining(valve_duration_data) is not None
         ):
-            valve_duration_data = self._device.valve_durations[self._valve_id]
-
-            if (
-                valve_duration_data.get("was_active")
-                and valve_duration_data.get("timestamp") != "N/A"
-                and isinstance(valve_duration_data.get("duration"), int)
-                and valve_duration_data.get("duration") > 0
-            ):
-                try:
-                    start_time = datetime.datetime.fromisoformat(
-                        valve_duration_data["timestamp"]
-                    )
-                    current_time = datetime.datetime.now(datetime.UTC)
-                    elapsed_seconds = int((current_time - start_time).total_seconds())
-                    remaining_seconds = max(
-                        0, valve_duration_data["duration"] - elapsed_seconds
-                    )
-
-                    # Update the remaining time and schedule HA state update
-                    old_remaining = valve_duration_data.get("remaining_time", -1)
-                    valve_duration_data["remaining_time"] = remaining_seconds
-
-                    _LOGGER.debug(
-                        "TIMER UPDATE - Valve %s: %d → %d seconds remaining",
-                        self._valve_id,
-                        old_remaining,
-                        remaining_seconds,
-                    )
-
-                    # Force Home Assistant to update the entity state
-                    self.async_schedule_update_ha_state(force_refresh=True)
-
-                except ValueError as e:
-                    _LOGGER.debug("Error in timer update: %s", e)
-
-    @property
-    def should_poll(self) -> bool:
-        """No polling needed for a smart irrigation control."""
-        return False
+            self.async_write_ha_state()
 
+    @callback
     def update_callback(self, device) -> None:
-        """Call update for Home Assistant when the device is updated."""
-        self.schedule_update_ha_state(force_refresh=True)
-
-    async def async_update(self) -> None:
-        """Update the states of Gardena devices."""
-        _LOGGER.debug("Running Gardena update")
-
-        # Check if we have a pending state change that should be respected
-        if (
-            self._pending_state_change is not None
-            and self._pending_state_timestamp is not None
-        ):
-            # Only respect pending state for defined timeout period
-            time_diff = (
-                datetime.datetime.now(tz=datetime.UTC) - self._pending_state_timestamp
-            )
-            if time_diff.total_seconds() < PENDING_STATE_TIMEOUT_SECONDS:
-                _LOGGER.debug("Skipping state update due to pending user action")
-                return
-            # Clear expired pending state
-            self._pending_state_change = None
-            self._pending_state_timestamp = None
-
-        # Managing state
-        valve = self._device.valves[self._valve_id]
-        _LOGGER.debug("Valve has state: %s", valve["state"])
-        if valve["state"] in ["WARNING", "ERROR", "UNAVAILABLE"]:
-            _LOGGER.debug("Valve has an error")
-            self._state = False
-            self._error_message = valve["last_error_code"]
-        else:
-            _LOGGER.debug("Getting Valve state")
-            activity = valve["activity"]
-            self._error_message = ""
-            _LOGGER.debug("Valve has activity: %s", activity)
-            if activity == "CLOSED":
-                self._state = False
-            elif activity in ["MANUAL_WATERING", "SCHEDULED_WATERING"]:
-                self._state = True
-            else:
-                _LOGGER.debug("Valve has unknown activity")
-
-        # IMPORTANT: Force remaining time recalculation during async_update
-        if (
-            hasattr(self._device, "valve_durations")
-            and self._valve_id in self._device.valve_durations
-        ):
-            valve_duration_data = self._device.valve_durations[self._valve_id]
-
+        """Recompute the state and follow it with the remaining time updates."""
+        super().update_callback(device)
+        self._sync_timer()
+
+    def _valve_state(self) -> str:
+        """Return the service state of the valve."""
+        return self._device.valves[self._valve_id]["state"]
+
+    def _valve_activity(self) -> str:
+        """Return the activity of the valve."""
+        return self._device.valves[self._valve_id]["activity"]
+
+    def _valve_error_code(self) -> str:
+        """Return the last error code of the valve."""
+        return self._device.valves[self._valve_id]["last_error_code"]
+
+    def _update_state(self) -> None:
+        """Derive the valve state and remaining time from the device data."""
+        super()._update_state()
+
+        # IMPORTANT: Force remaining time recalculation on every state update
+        valve_duration_data = (
+            self._device.valve_durations.get(self._valve_id)
+            if self._has_durations_map
+            else None
+        )
+        if valve_duration_data is not None:
             # Force recalculation of remaining time for active valves
-            if (
-                valve_duration_data.get("was_active")
-                and valve_duration_data.get("timestamp") != "N/A"
-                and isinstance(valve_duration_data.get("duration"), int)
-                and valve_duration_data.get("duration") > 0
-            ):
-                try:
-                    start_time = datetime.datetime.fromisoformat(
-                        valve_duration_data["timestamp"]
-                    )
-                    current_time = datetime.datetime.now(datetime.UTC)
-                    elapsed_seconds = int((current_time - start_time).total_seconds())
-                    remaining_seconds = max(
-                        0, valve_duration_data["duration"] - elapsed_seconds
-                    )
-
-                    # Update the remaining time in device data
-                    old_remaining = valve_duration_data.get("remaining_time", -1)
-                    valve_duration_data["remaining_time"] = remaining_seconds
-
-                    _LOGGER.debug(
-                        "ASYNC UPDATE - Valve %s: remaining %d → %d (elapsed=%d)",
-                        self._valve_id,
-                        old_remaining,
-                        remaining_seconds,
-                        elapsed_seconds,
-                    )
-                except Exception as e:
-                    _LOGGER.debug(
-                        "Error in async_update remaining time calculation: %s", e
-                    )
-            else:
-                _LOGGER.debug("Valve has unknown activity")
-
-    @property
-    def name(self):
-        """Return the name of the device."""
-        return self._name
-
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        return self._unique_id
-
-    @property
-    def is_closed(self) -> bool:
-        """Return true if the valve is closed."""
-        return not self._state
-
-    @property
-    def device_class(self):
-        """Return the device class for water valves."""
-        return ValveDeviceClass.WATER
-
-    @property
-    def supported_features(self):
-        """Return the supported features."""
-        return ValveEntityFeature.OPEN | ValveEntityFeature.CLOSE
-
-    @property
-    def reports_position(self) -> bool:
-        """Return False as this valve does not report position."""
-        return False
-
-    @property
-    def available(self):
-        """Return True if the device is available."""
-        return self._device.valves[self._valve_id]["state"] != "UNAVAILABLE"
-
-    def error(self):
-        """Return the error message."""
-        return self._error_message
+            self._recalc_remaining(valve_duration_data)
 
     @property
     def extra_state_attributes(self):
         """Return the state attributes of the smart irrigation control."""
-        _LOGGER.debug(
-            "REMAINING TIME DEBUG - extra_state_attributes called for valve %s",
-            self._valve_id,
-        )
-
-        attributes = {
-            ATTR_ACTIVITY: self._device.valves[self._valve_id]["activity"],
-            ATTR_RF_LINK_LEVEL: self._device.rf_link_level,
-            ATTR_RF_LINK_STATE: self._device.rf_link_state,
-            ATTR_LAST_ERROR: self._error_message,
-        }
+        device = self._device
+        valve_activity = device.valves[self._valve_id]["activity"]
+        is_valve_active = valve_activity in _ACTIVE_ACTIVITIES
 
         # Add valve-specific duration attributes if available
-        if (
-            hasattr(self._device, "valve_durations")
-            and self._valve_id in self._device.valve_durations
-        ):
-            valve_duration_data = self._device.valve_durations[self._valve_id]
-            _LOGGER.debug(
-                "REMAINING TIME DEBUG - Found valve_duration_data: %s",
-                valve_duration_data,
-            )
-
+        valve_duration_data = (
+            device.valve_durations.get(self._valve_id)
+            if self._has_durations_map
+            else None
+        )
+        if valve_duration_data is not None:
             # Calculate current remaining time if valve is active with API duration
-            if (
-                valve_duration_data.get("was_active")
-                and valve_duration_data.get("timestamp") != "N/A"
-                and isinstance(valve_duration_data.get("duration"), int)
-                and valve_duration_data.get("duration") > 0
-            ):
-                # Recalculate remaining time in real-time
-                try:
-                    start_time = datetime.datetime.fromisoformat(
-                        valve_duration_data["timestamp"]
-                    )
-                    current_time = datetime.datetime.now(datetime.UTC)
-                    elapsed_seconds = int((current_time - start_time).total_seconds())
-                    remaining_seconds = max(
-                        0, valve_duration_data["duration"] - elapsed_seconds
-                    )
-
-                    _LOGGER.debug(
-                        "REMAINING TIME DEBUG - Recalculated: start=%s, current=%s, elapsed=%d, remaining=%d",
-                        start_time,
-                        current_time,
-                        elapsed_seconds,
-                        remaining_seconds,
-                    )
-
-                    # Update the remaining time in device data
-                    valve_duration_data["remaining_time"] = remaining_seconds
-                except Exception as e:
-                    # Fallback to stored value
-                    _LOGGER.debug("REMAINING TIME DEBUG - Error in calculation: %s", e)
-            else:
-                _LOGGER.debug(
-                    "REMAINING TIME DEBUG - Conditions not met: was_active=%s, timestamp=%s, duration=%s",
-                    valve_duration_data.get("was_active"),
-                    valve_duration_data.get("timestamp"),
-                    valve_duration_data.get("duration"),
-                )
-
-            # Add duration attributes as numbers (seconds) - only if valve is active or has valid duration
-            valve_activity = self._device.valves.get(self._valve_id, {}).get(
-                "activity", "CLOSED"
-            )
-            is_valve_active = valve_activity in [
-                "MANUAL_WATERING",
-                "SCHEDULED_WATERING",
-            ]
-
-            _LOGGER.debug(
-                "REMAINING TIME DEBUG - valve_activity=%s, is_valve_active=%s",
-                valve_activity,
-                is_valve_active,
+            self._recalc_remaining(valve_duration_data)
+            durations = (
+                valve_duration_data.get("duration", 0),
+                valve_duration_data.get("timestamp"),
+                valve_duration_data.get("remaining_time", 0),
             )
-
-            # Only show duration attributes if valve is active OR if there's a meaningful duration > 0
-            if is_valve_active and valve_duration_data.get("duration", 0) > 0:
-                attributes["valve_duration"] = valve_duration_data["duration"]
-                _LOGGER.debug(
-                    "REMAINING TIME DEBUG - Added valve_duration: %s",
-                    valve_duration_data["duration"],
-                )
-
-            if is_valve_active and valve_duration_data.get("timestamp") != "N/A":
-                attributes["valve_duration_timestamp"] = valve_duration_data[
-                    "timestamp"
-                ]
-                _LOGGER.debug(
-                    "REMAINING TIME DEBUG - Added valve_duration_timestamp: %s",
-                    valve_duration_data["timestamp"],
-                )
-
-            if is_valve_active and valve_duration_data.get("remaining_time", 0) > 0:
-                attributes["valve_remaining_time"] = valve_duration_data[
-                    "remaining_time"
-                ]
-                _LOGGER.debug(
-                    "REMAINING TIME DEBUG - Added valve_remaining_time: %s",
-                    valve_duration_data["remaining_time"],
-                )
-            else:
-                _LOGGER.debug(
-                    "REMAINING TIME DEBUG - Not adding remaining_time: active=%s, remaining=%s",
-                    is_valve_active,
-                    valve_duration_data.get("remaining_time", 0),
-                )
         else:
             # Fallback to device-level attributes (for backwards compatibility)
-            valve_activity = self._device.valves.get(self._valve_id, {}).get(
-                "activity", "CLOSED"
+            durations = (
+                device.valve_duration if self._has_duration else None,
+                device.valve_duration_timestamp if self._has_duration_ts else None,
+                device.valve_remaining_time if self._has_remaining else None,
             )
-            is_valve_active = valve_activity in [
-                "MANUAL_WATERING",
-                "SCHEDULED_WATERING",
-            ]
-
-            # Only show duration attributes if valve is active AND has valid duration
-            if (
-                is_valve_active
-                and hasattr(self._device, "valve_duration")
-                and isinstance(self._device.valve_duration, int)
-                and self._device.valve_duration > 0
-            ):
-                attributes["valve_duration"] = self._device.valve_duration
-            if (
-                is_valve_active
-                and hasattr(self._device, "valve_duration_timestamp")
-                and self._device.valve_duration_timestamp != "N/A"
-            ):
-                attributes["valve_duration_timestamp"] = (
-                    self._device.valve_duration_timestamp
-                )
-            if (
-                is_valve_active
-                and hasattr(self._device, "valve_remaining_time")
-                and isinstance(self._device.valve_remaining_time, int)
-                and self._device.valve_remaining_time > 0
-            ):
-                attributes["valve_remaining_time"] = self._device.valve_remaining_time
 
+        # Reuse the previous dict while none of its inputs changed
+        key = (
+            valve_activity,
+            device.rf_link_level,
+            device.rf_link_state,
+            self._error_message,
+            valve_duration_data is not None,
+            durations,
+        )
+        if key == self._attrs_key:
+            return self._attrs_cache
+
+        attributes = {
+            ATTR_ACTIVITY: valve_activity,
+            ATTR_RF_LINK_LEVEL: device.rf_link_level,
+            ATTR_RF_LINK_STATE: device.rf_link_state,
+            ATTR_LAST_ERROR: self._error_message,
+        }
+
+        # Only show duration attributes while the valve is active
+        if is_valve_active:
+            duration, timestamp, remaining_time = durations
+            if valve_duration_data is not None:
+                if duration > 0:
+                    attributes["valve_duration"] = duration
+                if timestamp != "N/A":
+                    attributes["valve_duration_timestamp"] = timestamp
+                if remaining_time > 0:
+                    attributes["valve_remaining_time"] = remaining_time
+            else:
+                if isinstance(duration, int) and duration > 0:
+                    attributes["valve_duration"] = duration
+                if self._has_duration_ts and timestamp != "N/A":
+                    attributes["valve_duration_timestamp"] = timestamp
+                if isinstance(remaining_time, int) and remaining_time > 0:
+                    attributes["valve_remaining_time"] = remaining_time
+
+        self._attrs_key = key
+        self._attrs_cache = attributes
         return attributes
 
     @property
@@ -615,31 +534,15 @@ class GardenaSmartIrrigationControl(ValveEntity):
         """Open the valve to start watering."""
         duration = self.option_smart_irrigation_duration * 60
         await self._device.start_seconds_to_override(duration, self._valve_id)
-        # Set pending state to prevent immediate override
-        self._pending_state_change = True
-        self._pending_state_timestamp = datetime.datetime.now(tz=datetime.UTC)
-        # Immediately update state for responsive UI
-        self._state = True
+        # Immediately update state for responsive UI, holding off device updates
+        self._set_pending(True)
+        self._sync_timer()
         self.async_write_ha_state()
 
     async def async_close_valve(self) -> None:
         """Close the valve to stop watering."""
         await self._device.stop_until_next_task(self._valve_id)
-        # Set pending state to prevent immediate override
-        self._pending_state_change = False
-        self._pending_state_timestamp = datetime.datetime.now(tz=datetime.UTC)
-        # Immediately update state for responsive UI
-        self._state = False
+        # Immediately update state for responsive UI, holding off device updates
+        self._set_pending(False)
+        self._sync_timer()
         self.async_write_ha_state()
-
-    @property
-    def device_info(self):
-        return {
-            "identifiers": {
-                # Serial numbers are unique identifiers within a specific domain
-                (DOMAIN, self._device.serial)
-            },
-            "name": self._device.name,
-            "manufacturer": "Gardena",
-            "model": self._device.model_type,
-        }